@@ -0,0 +1,22 @@
+# app/api/params.py
+"""Parâmetros de rota/query reutilizáveis.
+
+Definidos uma vez no import do módulo e compartilhados pelos routers. Usamos
+`Annotated` (e não `x: int = Path(...)` compartilhado) porque o FastAPI copia o
+FieldInfo por parâmetro; um mesmo objeto `Path` como default teria o alias
+sobrescrito pelo primeiro endpoint que o usasse.
+
+Uso: `def get_x(x_id: IdPath, limit: LimitQuery = 10, cursor: CursorQuery = None)`.
+"""
+from __future__ import annotations
+
+from typing import Annotated, Optional
+
+from fastapi import Path, Query
+
+IdPath = Annotated[int, Path(ge=1)]
+LimitQuery = Annotated[
+    int, Query(ge=1, le=100, description="Número máximo de registros a retornar")
+]
+OffsetQuery = Annotated[int, Query(ge=0)]
+CursorQuery = Annotated[Optional[str], Query(description="`next_cursor` da página anterior")]
@@ -1,12 +1,19 @@
 # app/routers/docentes.py
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Path, Query, status, HTTPException
-from sqlalchemy.orm import Session
+from typing import Annotated
 
-from app.deps import get_db
+from fastapi import APIRouter, Depends, Path, Request, status, HTTPException
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+from app.api.params import CursorQuery, LimitQuery
+from app.core.etag import conditional
+from app.core.serialization import json_response, orm_list, schema_fields
+from app.deps import get_docente_service
 from app.services.docente_service import DocenteService
 from app.schemas.docente import (
+    DocenteBulkCreate,
     DocenteCreate,
     DocenteUpdate,
     DocenteRead,
@@ -15,6 +22,12 @@ from app.schemas.docente import (
 
 router = APIRouter(prefix="/docentes", tags=["Docentes"])
 
+# Validador compilado uma vez: converte a página inteira (ORM -> schema) numa única chamada
+_DOCENTE_LIST_ADAPTER = TypeAdapter(list[DocenteRead])
+_DOCENTE_FIELDS = schema_fields(DocenteRead)
+
+DocenteIdPath = Annotated[int, Path(ge=1, description="ID do docente")]
+
 
 # ----------------- CREATE -----------------
 @router.post(
@@ -23,8 +36,26 @@ router = APIRouter(prefix="/docentes", tags=["Docentes"])
     status_code=status.HTTP_201_CREATED,
     summary="Criar um novo docente",
 )
-def create_docente(payload: DocenteCreate, db: Session = Depends(get_db)) -> DocenteRead:
-    return DocenteService(db).create_docente(payload)
+def create_docente(
+    payload: DocenteCreate,
+    service: DocenteService = Depends(get_docente_service),
+) -> DocenteRead:
+    return service.create_docente(payload)
+
+
+@router.post(
+    "/bulk",
+    responses={201: {"model": list[DocenteRead]}},
+    status_code=status.HTTP_201_CREATED,
+    summary="Criar docentes em lote (importação)",
+)
+def bulk_create_docentes(
+    payload: DocenteBulkCreate,
+    service: DocenteService = Depends(get_docente_service),
+) -> Response:
+    docentes = service.bulk_create_docentes(payload)
+    items = orm_list(DocenteRead, docentes, fields=_DOCENTE_FIELDS, adapter=_DOCENTE_LIST_ADAPTER)
+    return json_response(items, adapter=_DOCENTE_LIST_ADAPTER, status_code=status.HTTP_201_CREATED)
 
 
 # ----------------- READ (by ID) -----------------
@@ -34,28 +65,31 @@ def create_docente(payload: DocenteCreate, db: Session = Depends(get_db)) -> Doc
     summary="Obter docente por ID",
 )
 def get_docente(
-    docente_id: int = Path(..., ge=1, description="ID do docente"),
-    db: Session = Depends(get_db),
+    docente_id: DocenteIdPath,
+    service: DocenteService = Depends(get_docente_service),
 ) -> DocenteRead:
-    return DocenteService(db).get_docente(docente_id)
+    return service.get_docente(docente_id)
 
 
-# ----------------- LIST (paginação offset/limit) -----------------
+# ----------------- LIST (paginação por cursor/limit) -----------------
 @router.get(
     "",
-    response_model=DocenteList,
-    summary="Listar docentes paginados",
+    responses={200: {"model": DocenteList}},
+    summary="Listar docentes paginados (cursor)",
 )
 def list_docentes(
-    skip: int = Query(0, ge=0, description="Número de registros a pular"),
-    limit: int = Query(10, ge=1, le=100, description="Número máximo de registros a retornar"),
-    db: Session = Depends(get_db),
-) -> DocenteList:
-    items, total = DocenteService(db).list_docentes(skip=skip, limit=limit)
-    return DocenteList(
-        items=[DocenteRead.model_validate(obj) for obj in items],
-        total=total,
+    request: Request,
+    cursor: CursorQuery = None,
+    limit: LimitQuery = 10,
+    service: DocenteService = Depends(get_docente_service),
+) -> Response:
+    items, next_cursor, has_more = service.list_docentes(limit=limit, cursor=cursor)
+    page = DocenteList(
+        items=orm_list(DocenteRead, items, fields=_DOCENTE_FIELDS, adapter=_DOCENTE_LIST_ADAPTER),
+        next_cursor=next_cursor,
+        has_more=has_more,
     )
+    return conditional(request, json_response(page))
 
 
 # ----------------- UPDATE -----------------
@@ -66,11 +100,11 @@ def list_docentes(
     summary="Atualizar (PUT) docente",
 )
 def update_docente(
-    docente_id: int = Path(..., ge=1),
+    docente_id: DocenteIdPath,
     payload: DocenteUpdate = ...,
-    db: Session = Depends(get_db),
+    service: DocenteService = Depends(get_docente_service),
 ) -> DocenteRead:
-    return DocenteService(db).update_docente(docente_id, payload)
+    return service.update_docente(docente_id, payload)
 
 @router.patch(
     "/{docente_id}",
@@ -79,11 +113,11 @@ def update_docente(
     summary="Atualização parcial (PATCH) de docente",
 )
 def patch_docente(
-    docente_id: int = Path(..., ge=1),
+    docente_id: DocenteIdPath,
     payload: DocentePatch = ...,
-    db: Session = Depends(get_db),
+    service: DocenteService = Depends(get_docente_service),
 ) -> DocenteRead:
-    return DocenteService(db).patch_docente(docente_id, payload)
+    return service.patch_docente(docente_id, payload)
 
 
 # ----------------- DELETE -----------------
@@ -94,10 +128,9 @@ def patch_docente(
     summary="Remove um docente",
 )
 def delete_docente(
-    docente_id: int = Path(..., ge=1, description="ID do docente"),
-    db: Session = Depends(get_db),
+    docente_id: DocenteIdPath,
+    service: DocenteService = Depends(get_docente_service),
 ) -> dict[str, str]:
-    service = DocenteService(db)
     ok = service.delete_docente(docente_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Docente não encontrado")
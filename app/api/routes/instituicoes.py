@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 
-from app.deps import get_db
+from app.core.serialization import json_response, orm_list, schema_fields, to_model_kwargs
+from app.api.params import IdPath, LimitQuery, CursorQuery
+from app.core.etag import conditional
+from app.deps import get_instituicao_service
 from app.services.instituicao_service import InstituicaoService
 from app.schemas.instituicao import (
     InstituicaoCreate,
@@ -12,10 +15,15 @@ from app.schemas.instituicao import (
     InstituicaoPut,
     InstituicaoRead,
     InstituicaoList,
+    INSTITUICAO_READ_COERCE,
 )
 
 router = APIRouter(prefix="/instituicoes", tags=["instituicoes"])
 
+# Validador compilado uma vez: converte a página inteira (ORM -> schema) numa única chamada
+_INSTITUICAO_LIST_ADAPTER = TypeAdapter(list[InstituicaoRead])
+_INSTITUICAO_FIELDS = schema_fields(InstituicaoRead)
+
 
 @router.post(
     "",
@@ -25,33 +33,37 @@ router = APIRouter(prefix="/instituicoes", tags=["instituicoes"])
 )
 def create_instituicao(
     payload: InstituicaoCreate,
-    db: Session = Depends(get_db),
+    service: InstituicaoService = Depends(get_instituicao_service),
 ) -> InstituicaoRead:
-    service = InstituicaoService(db)  # ✅ passa a Session
-    try:
-        obj = service.create(payload.model_dump())
-    except IntegrityError:
-        db.rollback()
-        raise HTTPException(status_code=409, detail="Violação de unicidade")
-    return InstituicaoRead.model_validate(obj)
+    # IntegrityError (unicidade) -> rollback + 409 no handler global (app/core/errors.py)
+    obj = service.create(to_model_kwargs(payload))
+    return obj  # response_model valida/serializa uma única vez
 
 
 @router.get(
     "",
-    response_model=InstituicaoList,
-    summary="Lista instituições paginadas (limit/offset)",
+    responses={200: {"model": InstituicaoList}},
+    summary="Lista instituições paginadas (cursor/limit)",
 )
 def list_instituicoes(
-    db: Session = Depends(get_db),
-    limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
-) -> InstituicaoList:
-    service = InstituicaoService(db)  # ✅
-    items, total = service.list(limit, offset)
-    return InstituicaoList(
-        items=[InstituicaoRead.model_validate(obj) for obj in items],
-        total=total,
+    request: Request,
+    service: InstituicaoService = Depends(get_instituicao_service),
+    limit: LimitQuery = 10,
+    cursor: CursorQuery = None,
+) -> Response:
+    items, next_cursor, has_more = service.list(limit, cursor)
+    page = InstituicaoList(
+        items=orm_list(
+            InstituicaoRead,
+            items,
+            fields=_INSTITUICAO_FIELDS,
+            adapter=_INSTITUICAO_LIST_ADAPTER,
+            coerce=INSTITUICAO_READ_COERCE,
+        ),
+        next_cursor=next_cursor,
+        has_more=has_more,
     )
+    return conditional(request, json_response(page))
 
 
 @router.get(
@@ -60,14 +72,10 @@ def list_instituicoes(
     summary="Obtém instituição por ID",
 )
 def get_instituicao(
-    instituicao_id: int = Path(..., ge=1),
-    db: Session = Depends(get_db),
+    instituicao_id: IdPath,
+    service: InstituicaoService = Depends(get_instituicao_service),
 ) -> InstituicaoRead:
-    service = InstituicaoService(db)  # ✅
-    obj = service.get(instituicao_id)
-    if not obj:
-        raise HTTPException(status_code=404, detail="Instituição não encontrada")
-    return InstituicaoRead.model_validate(obj)
+    return service.get(instituicao_id)  # response_model valida/serializa uma única vez
 
 
 @router.put(
@@ -77,17 +85,11 @@ def get_instituicao(
     summary="Atualiza instituição (substituição total)",
 )
 def put_instituicao(
-    instituicao_id: int = Path(..., ge=1),
+    instituicao_id: IdPath,
     payload: InstituicaoPut = ...,
-    db: Session = Depends(get_db),
+    service: InstituicaoService = Depends(get_instituicao_service),
 ) -> InstituicaoRead:
-    service = InstituicaoService(db)  # ✅
-    try:
-        obj = service.put(instituicao_id, payload)
-    except IntegrityError:
-        db.rollback()
-        raise HTTPException(status_code=409, detail="Violação de unicidade")
-    return InstituicaoRead.model_validate(obj)
+    return service.put(instituicao_id, payload)
 
 
 @router.patch(
@@ -96,19 +98,11 @@ def put_instituicao(
     summary="Atualização parcial da instituição",
 )
 def patch_instituicao(
-    instituicao_id: int = Path(..., ge=1),
+    instituicao_id: IdPath,
     payload: InstituicaoUpdate = ...,
-    db: Session = Depends(get_db),
+    service: InstituicaoService = Depends(get_instituicao_service),
 ) -> InstituicaoRead:
-    service = InstituicaoService(db)  # ✅
-    try:
-        obj = service.patch(instituicao_id, payload)
-    except IntegrityError:
-        db.rollback()
-        raise HTTPException(status_code=409, detail="Violação de unicidade")
-    if not obj:
-        raise HTTPException(status_code=404, detail="Instituição não encontrada")
-    return InstituicaoRead.model_validate(obj)
+    return service.patch(instituicao_id, payload)  # 404 levantado pelo service
 
 
 @router.delete(
@@ -117,10 +111,9 @@ def patch_instituicao(
     summary="Remove uma instituição",
 )
 def delete_instituicao(
-    instituicao_id: int = Path(..., ge=1),
-    db: Session = Depends(get_db),
+    instituicao_id: IdPath,
+    service: InstituicaoService = Depends(get_instituicao_service),
 ) -> dict[str, str]:
-    service = InstituicaoService(db)  # ✅
     ok = service.delete(instituicao_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Instituição não encontrada")
@@ -1,16 +1,33 @@
 from __future__ import annotations
-from fastapi import APIRouter, Depends
+
+import datetime
+import socket
+import time
+
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy import text
 from sqlalchemy.orm import Session
-import datetime, socket
 
+from app.core.config import settings
+from app.db.session import probe_engine
 from app.deps import get_db
 
 router = APIRouter(prefix="", tags=["monitoring"])
 
+# Resolvido uma vez: gethostname() pode bloquear no resolver em alguns sistemas
+_HOSTNAME = socket.gethostname()
+
+# Probes do k8s batem a cada poucos segundos; um "OK" recente dispensa novo ping no banco
+_READY_TTL = 1.0  # segundos
+_last_ok: float = 0.0  # time.monotonic() do último SELECT 1 bem-sucedido
+
+# Schemas quase nunca mudam: o /hp relista o catálogo no máximo a cada _SCHEMAS_TTL
+_SCHEMAS_TTL = 30.0  # segundos
+_schemas_cache: tuple[float, list[str]] | None = None  # (monotonic, schemas)
+
 
 @router.get("/healthz2")
-def healthz() -> dict[str, str]:
+async def healthz() -> dict[str, str]:
     """
     Health check básico da aplicação.
     - Apenas retorna status `ok`.
@@ -18,22 +35,117 @@ def healthz() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@router.get("/ping")
+async def ping() -> dict[str, bool]:
+    return {"pong": True}
+
+
+@router.get("/routers-ping")
+async def routers_ping(request: Request) -> dict:
+    """
+    Lista todas as rotas registradas no FastAPI.
+    Útil para verificar se os routers foram incluídos corretamente.
+    """
+    routers_info = []
+    for route in request.app.routes:
+        if hasattr(route, "methods"):
+            routers_info.append({
+                "path": route.path,
+                "methods": list(route.methods),
+                "name": route.name,
+            })
+
+    return {
+        "total_routes": len(routers_info),
+        "routers": routers_info
+    }
+
+
 @router.get("/readyz")
-def readyz(db: Session = Depends(get_db)) -> dict[str, str]:
+def readyz() -> dict[str, str]:
     """
     Readiness check.
     Verifica se a API está viva e se o banco responde a um ping simples.
+    Um ping bem-sucedido é reaproveitado por `_READY_TTL` segundos. O ping usa o
+    `probe_engine` (pool próprio de 1-2 conexões), nunca o pool das rotas.
     """
+    global _last_ok
     health: dict[str, str] = {
         "app_status": "ok",
-        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
-        "hostname": socket.gethostname(),
+        "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+        "hostname": _HOSTNAME,
     }
+    now = time.monotonic()
+    if now - _last_ok < _READY_TTL:
+        health["database"] = "connected"
+        return health
     try:
         # ping no BD; .scalar() força execução e leitura
-        db.scalar(text("SELECT 1"))
+        with probe_engine.connect() as conn:
+            conn.scalar(text("SELECT 1"))
+        _last_ok = now
         health["database"] = "connected"
     except Exception as e:
         # se você já registrou handlers globais, pode relançar; aqui devolvemos status legível
         health["database"] = f"error: {e.__class__.__name__}: {e}"
     return health
+
+
+@router.get("/testdb")
+def test_db(db: Session = Depends(get_db)) -> dict[str, str]:
+    # SQLAlchemy 2: SQL cru precisa de text(); scalar() devolve o valor sem montar Row
+    return {"ok": str(db.scalar(text("SELECT 1")))}
+
+
+@router.get("/hp")
+def health_plus() -> dict:
+    """
+    Health check avançado:
+    - Status da aplicação
+    - Conexão e tempo de resposta do banco
+    - Schemas disponíveis
+    - Ambiente e versão da aplicação
+    Como o `/readyz`, usa o `probe_engine`: não ocupa conexões do pool das rotas.
+    A lista de schemas vem de cache por `_SCHEMAS_TTL` segundos; o ping é sempre feito.
+    """
+    global _schemas_cache
+    health = {
+        "app_status": "ok",
+        "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),  # como no /readyz
+        "hostname": _HOSTNAME,
+        "environment": settings.ENVIRONMENT,
+        "database": {},
+    }
+
+    # Testa conexão com o banco e mede latência
+    try:
+        with probe_engine.connect() as conn:
+            start = time.perf_counter()
+            conn.scalar(text("SELECT 1"))
+            latency = (time.perf_counter() - start) * 1000  # ms
+            health["database"]["status"] = "connected"
+            health["database"]["latency_ms"] = round(latency, 2)
+
+            # Lista schemas disponíveis
+            now = time.monotonic()
+            if _schemas_cache and now - _schemas_cache[0] < _SCHEMAS_TTL:
+                schemas = _schemas_cache[1]
+            else:
+                schemas = list(
+                    conn.scalars(text("SELECT schema_name FROM information_schema.schemata"))
+                )
+                _schemas_cache = (now, schemas)
+        health["database"]["schemas"] = schemas
+
+        # Valida se os schemas críticos existem
+        required = {"auth", "core", "academic"}
+        missing = list(required - set(schemas))
+        health["database"]["required_schemas_ok"] = not missing
+        if missing:
+            health["database"]["missing_schemas"] = missing
+
+    except Exception as e:
+        health["database"]["status"] = "error"
+        health["database"]["detail"] = str(e)
+
+    return health
@@ -1,9 +1,11 @@
 from __future__ import annotations
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
-from sqlalchemy.orm import Session
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import Response
 
-from app.deps import get_db
+from app.api.params import IdPath, LimitQuery, CursorQuery
+from app.core.etag import conditional
+from app.core.serialization import json_response
+from app.deps import get_programa_service, get_usuario_programa_role_service
 from app.services.programa_service import ProgramaService
 from app.schemas.programa import (
     ProgramaCreate,
@@ -23,8 +25,10 @@ router = APIRouter(prefix="/programas", tags=["programas"])
     status_code=status.HTTP_201_CREATED,
     summary="Criar um novo programa",
 )
-def create_programa(payload: ProgramaCreate, db: Session = Depends(get_db)):
-    service = ProgramaService(db)
+def create_programa(
+    payload: ProgramaCreate,
+    service: ProgramaService = Depends(get_programa_service),
+):
     return service.create_programa(payload)
 
 
@@ -34,30 +38,31 @@ def create_programa(payload: ProgramaCreate, db: Session = Depends(get_db)):
     response_model=ProgramaRead,
     summary="Obter programa por ID",
 )
-def get_programa(programa_id: int = Path(..., ge=1), db: Session = Depends(get_db)):
-    service = ProgramaService(db)
-    obj = service.get_programa(programa_id)
-    if not obj:
-        raise HTTPException(status_code=404, detail="Programa não encontrado")
-    return obj
+def get_programa(
+    programa_id: IdPath,
+    service: ProgramaService = Depends(get_programa_service),
+):
+    return service.get_programa(programa_id)
 
 
 @router.get(
     "",
-    response_model=ProgramaList,
+    responses={200: {"model": ProgramaList}},
     summary="Listar programas paginados",
 )
 def list_programas(
-    limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> ProgramaList:
-    service = ProgramaService(db)
-    items, total = service.list_programas(limit=limit, offset=offset)
-    return ProgramaList(
-        items=[ProgramaRead.model_validate(obj) for obj in items],
-        total=total,
+    request: Request,
+    limit: LimitQuery = 10,
+    cursor: CursorQuery = None,
+    service: ProgramaService = Depends(get_programa_service),
+) -> Response:
+    items, next_cursor, has_more = service.list_programas(limit=limit, cursor=cursor)
+    page = ProgramaList(
+        items=items,  # já convertidos (ProgramaRead) pelo service
+        next_cursor=next_cursor,
+        has_more=has_more,
     )
+    return conditional(request, json_response(page))
 
 # ----------------- UPDATE -----------------
 
@@ -66,8 +71,11 @@ def list_programas(
     response_model=ProgramaRead,
     summary="Atualizar um programa (PUT)",
 )
-def update_programa(programa_id: int, payload: ProgramaUpdate, db: Session = Depends(get_db)):
-    service = ProgramaService(db)
+def update_programa(
+    programa_id: IdPath,
+    payload: ProgramaUpdate,
+    service: ProgramaService = Depends(get_programa_service),
+):
     return service.update_programa(programa_id, payload)
 
 
@@ -77,8 +85,11 @@ def update_programa(programa_id: int, payload: ProgramaUpdate, db: Session = Dep
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Remover programa",
 )
-def delete_programa(programa_id: int, db: Session = Depends(get_db), hard: bool = False):
-    service = ProgramaService(db)
+def delete_programa(
+    programa_id: IdPath,
+    service: ProgramaService = Depends(get_programa_service),
+    hard: bool = False,
+):
     ok = service.delete_programa(programa_id, hard=hard)
     if not ok:
         raise HTTPException(status_code=404, detail="Programa não encontrado")
@@ -93,11 +104,10 @@ def delete_programa(programa_id: int, db: Session = Depends(get_db), hard: bool
     summary="Desvincular um usuário de um programa",
 )
 def desvincular_usuario_programa(
-    programa_id: int,
-    usuario_id: int,
-    db: Session = Depends(get_db),
+    programa_id: IdPath,
+    usuario_id: IdPath,
+    service: UsuarioProgramaRoleService = Depends(get_usuario_programa_role_service),
 ):
-    service = UsuarioProgramaRoleService(db)
     ok = service.desvincular_usuario_programa(usuario_id, programa_id)
     if not ok:
         raise HTTPException(
@@ -3,10 +3,11 @@ from __future__ import annotations
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
+from fastapi.responses import Response
 
-from app.deps import get_db
+from app.api.params import IdPath
+from app.core.serialization import json_response
+from app.deps import get_role_service
 from app.schemas.role import RoleCreate, RoleUpdate, RoleRead
 from app.services.role_service import RoleService
 
@@ -19,40 +20,34 @@ router = APIRouter(prefix="/roles", tags=["roles"])
     status_code=status.HTTP_201_CREATED,
     summary="Criar role",
 )
-def create_role(payload: RoleCreate, db: Session = Depends(get_db)) -> RoleRead:
-    """Cria uma nova role (nome único)."""
-    svc = RoleService(db)
-    try:
-        return svc.create(payload)
-    except IntegrityError:
-        db.rollback()
-        raise HTTPException(status_code=409, detail="Violação de unicidade")
+def create_role(
+    payload: RoleCreate,
+    svc: RoleService = Depends(get_role_service),
+) -> RoleRead:
+    """Cria uma nova role (nome único; duplicidade vira 409 no handler global)."""
+    return svc.create(payload)
 
 
 @router.get(
     "",
-    response_model=List[RoleRead],
+    responses={200: {"model": List[RoleRead]}},
     summary="Listar roles",
 )
-def list_roles(db: Session = Depends(get_db)) -> List[RoleRead]:
+def list_roles(svc: RoleService = Depends(get_role_service)) -> Response:
     """Lista todas as roles."""
-    svc = RoleService(db)
-    items, _ = svc.list()
-    return items
+    # Bytes JSON prontos (cache por worker): sem query nem serialização no hit
+    return Response(svc.list_json(), media_type="application/json")
 
 
 @router.get(
     "/{role_id}",
-    response_model=RoleRead,
+    responses={200: {"model": RoleRead}},
     summary="Obter role por ID",
 )
-def get_role(role_id: int, db: Session = Depends(get_db)) -> RoleRead:
+def get_role(role_id: IdPath, svc: RoleService = Depends(get_role_service)) -> Response:
     """Retorna uma role pelo ID."""
-    svc = RoleService(db)
-    obj = svc.get(role_id)
-    if not obj:
-        raise HTTPException(status_code=404, detail="Role não encontrada")
-    return obj
+    role = svc.get(role_id)  # RoleRead (cache) já pronto
+    return json_response(role)
 
 
 @router.put(
@@ -60,9 +55,12 @@ def get_role(role_id: int, db: Session = Depends(get_db)) -> RoleRead:
     response_model=RoleRead,
     summary="Atualizar role",
 )
-def update_role(role_id: int, payload: RoleUpdate, db: Session = Depends(get_db)) -> RoleRead:
+def update_role(
+    role_id: IdPath,
+    payload: RoleUpdate,
+    svc: RoleService = Depends(get_role_service),
+) -> RoleRead:
     """Atualiza uma role existente."""
-    svc = RoleService(db)
     obj = svc.update(role_id, payload)
     if not obj:
         raise HTTPException(status_code=404, detail="Role não encontrada")
@@ -74,9 +72,8 @@ def update_role(role_id: int, payload: RoleUpdate, db: Session = Depends(get_db)
     status_code=status.HTTP_200_OK,
     summary="Remover role",
 )
-def delete_role(role_id: int, db: Session = Depends(get_db)) -> dict[str, str]:
+def delete_role(role_id: IdPath, svc: RoleService = Depends(get_role_service)) -> dict[str, str]:
     """Remove uma role pelo ID."""
-    svc = RoleService(db)
     ok = svc.delete(role_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Role não encontrada")
@@ -1,14 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
-from sqlalchemy.orm import Session
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import Response, StreamingResponse
+from typing import Iterator, Optional
 
-from app.deps import get_db
+from app.api.params import IdPath, LimitQuery, OffsetQuery
+from app.core.serialization import json_response
+from app.db.session import SessionLocal
+from app.deps import get_usuario_service
 from app.services.usuario_service import UsuarioService
 from app.schemas.usuario import UsuarioCreate, UsuarioUpdate, UsuarioRead, UsuarioList
 
 
 router = APIRouter(prefix="/usuarios", tags=["usuarios"])
 
+NDJSON = "application/x-ndjson"
+_NDJSON_CHUNK = 50  # linhas por chunk enviado (cada chunk é um salto ao threadpool)
+
+
+def _ndjson_usuarios(limit: int, offset: int, ativo: Optional[bool]) -> Iterator[bytes]:
+    """Uma linha JSON por usuário, enviada em chunks conforme o cursor avança.
+
+    O corpo é consumido depois que o middleware já encerrou a sessão do request,
+    então o streaming abre (e fecha ao fim do gerador) uma sessão própria.
+    """
+    with SessionLocal.session_factory() as db:
+        chunk: list[bytes] = []
+        for usuario in UsuarioService(db).iter_usuarios(limit=limit, offset=offset, ativo=ativo):
+            chunk.append(usuario.model_dump_json().encode())
+            if len(chunk) == _NDJSON_CHUNK:
+                yield b"\n".join(chunk) + b"\n"
+                chunk.clear()
+        if chunk:
+            yield b"\n".join(chunk) + b"\n"
+
 
 # ----------------- CREATE -----------------
 @router.post(
@@ -17,8 +40,9 @@ router = APIRouter(prefix="/usuarios", tags=["usuarios"])
     status_code=status.HTTP_201_CREATED,
     summary="Criar um novo usuário",
 )
-def create_usuario(payload: UsuarioCreate, db: Session = Depends(get_db)):
-    service = UsuarioService(db)
+def create_usuario(
+    payload: UsuarioCreate, service: UsuarioService = Depends(get_usuario_service)
+):
     try:
         return service.create_usuario(payload)  # ✅ método correto no service
     except ValueError as e:
@@ -28,48 +52,54 @@ def create_usuario(payload: UsuarioCreate, db: Session = Depends(get_db)):
 # ----------------- READ -----------------
 @router.get(
     "/{usuario_id}",
-    response_model=UsuarioRead,
+    responses={200: {"model": UsuarioRead}},
     summary="Obter usuário por ID",
 )
-def get_usuario(usuario_id: int = Path(..., ge=1), db: Session = Depends(get_db)):
-    service = UsuarioService(db)
+def get_usuario(
+    usuario_id: IdPath, service: UsuarioService = Depends(get_usuario_service)
+) -> Response:
     obj = service.get_usuario(usuario_id)  # ✅ método correto
     if not obj:
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
-    return obj
+    return json_response(obj)
 
 
 @router.get(
     "",
-    response_model=UsuarioList,
+    responses={200: {"model": UsuarioList}},
     summary="Listar usuários paginados",
 )
 def list_usuarios(
-    limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    request: Request,
+    limit: LimitQuery = 10,
+    offset: OffsetQuery = 0,
     ativo: Optional[bool] = Query(None),
-    db: Session = Depends(get_db),
-) -> UsuarioList:
-    service = UsuarioService(db)
+    service: UsuarioService = Depends(get_usuario_service),
+) -> Response:
+    """Página `{items, total}`; com `Accept: application/x-ndjson`, um usuário por linha."""
+    if NDJSON in request.headers.get("accept", ""):
+        # Sem `total` (exigiria a página inteira antes do primeiro byte)
+        return StreamingResponse(_ndjson_usuarios(limit, offset, ativo), media_type=NDJSON)
     items, total = service.list_usuarios(limit=limit, offset=offset, ativo=ativo)  # ✅ método correto
-    return UsuarioList(
-        items=[UsuarioRead.model_validate(obj) for obj in items],
-        total=total,
-    )
+    page = UsuarioList(items=items, total=total)  # items já são UsuarioRead (service)
+    return json_response(page)
 
 
 # ----------------- UPDATE -----------------
 @router.put(
     "/{usuario_id}",
-    response_model=UsuarioRead,
+    responses={200: {"model": UsuarioRead}},
     summary="Atualizar um usuário",
 )
-def update_usuario(usuario_id: int, payload: UsuarioUpdate, db: Session = Depends(get_db)):
-    service = UsuarioService(db)
+def update_usuario(
+    usuario_id: IdPath,
+    payload: UsuarioUpdate,
+    service: UsuarioService = Depends(get_usuario_service),
+) -> Response:
     obj = service.update_usuario(usuario_id, payload)  # ✅ método correto
     if not obj:
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
-    return obj
+    return json_response(obj)
 
 
 # ----------------- DELETE -----------------
@@ -78,8 +108,11 @@ def update_usuario(usuario_id: int, payload: UsuarioUpdate, db: Session = Depend
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Remover usuário",
 )
-def delete_usuario(usuario_id: int, db: Session = Depends(get_db), hard: bool = False):
-    service = UsuarioService(db)
+def delete_usuario(
+    usuario_id: IdPath,
+    service: UsuarioService = Depends(get_usuario_service),
+    hard: bool = False,
+):
     ok = service.delete_usuario(usuario_id, hard=hard)  # ✅ método correto
     if not ok:
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
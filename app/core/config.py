@@ -1,4 +1,6 @@
 from __future__ import annotations
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -7,10 +9,51 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     ENVIRONMENT: str = "development"  # development, staging, production
 
+    # Pool de conexões (por worker):
+    #   (DB_POOL_SIZE + DB_MAX_OVERFLOW) * nº de workers uvicorn <= max_connections do Postgres
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 600  # segundos
+    # Ping a cada checkout: conexão derrubada (failover, restart, PgBouncer) é trocada antes
+    # de chegar ao request. Os keepalives TCP só a detectam após ~80s ociosa; desligar
+    # economiza um round-trip por checkout e expõe o primeiro request após a queda ao erro.
+    DB_POOL_PRE_PING: bool = True
+    # Espera máxima por uma conexão livre; esgotado, o request vira 503 (em vez de travar 30s)
+    DB_POOL_TIMEOUT: int = 5  # segundos
+    # Cache de SQL compilado do SQLAlchemy (entradas por engine; padrão da lib: 500)
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # psycopg 3: após N execuções a query vira prepared statement no servidor.
+    # None desliga (necessário atrás de PgBouncer em modo transaction).
+    DB_PREPARE_THRESHOLD: int | None = 5
+
+    # Threads para rotas/dependências `def` (anyio usa 40 por padrão).
+    # Acompanha o pool: DB_POOL_SIZE + DB_MAX_OVERFLOW requests simultâneos com o banco.
+    THREADPOOL_SIZE: int = 60
+
+    # DDL no startup (create_all); desligue quando o schema vier do Alembic (migrations/)
+    DB_CREATE_ALL_ON_STARTUP: bool = True
+
+    # Cache de GET por ID (app/core/entity_cache.py), por worker e sem invalidação
+    # entre workers: o TTL é a defasagem máxima aceita após uma escrita em outro processo
+    ENTITY_CACHE_TTL: float = 1.0  # segundos
+    ENTITY_CACHE_MAXSIZE: int = 10_000
+
+    # Listagens: ORM -> schema via model_construct (sem revalidar dados do banco)
+    FAST_ORM_SCHEMA: bool = True
+
+    # Dev/CI: relacionamentos de Docente/Programa levantam erro em vez de lazy-load (N+1)
+    ORM_STRICT_LOADING: bool = False
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
     )
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Instância única de Settings (lê env/.env uma vez); usável como dependência."""
+    return Settings()
+
+
+settings = get_settings()
@@ -0,0 +1,101 @@
+# app/core/entity_cache.py
+"""Cache read-through (em memória, por worker) para GET por ID.
+
+Guarda o schema *Read* já validado (nunca o objeto ORM, que pertence a uma
+Session) com chave `(entidade, id)`. Escritas invalidam a chave após o commit,
+mas só no worker que as executou: não há invalidação entre processos. Os outros
+workers podem servir o valor antigo por até `ENTITY_CACHE_TTL` segundos (padrão
+1s). O cache absorve rajadas de leituras do mesmo ID, não substitui o banco; para
+TTL longo com consistência entre workers, trocar por Redis (GET/SETEX + pub/sub).
+
+Tabelas de lookup quase estáticas (ex.: roles) também podem guardar a listagem
+completa já serializada em JSON (`cached_payload`); qualquer escrita na entidade
+descarta esses bytes junto com a chave do ID.
+"""
+from __future__ import annotations
+
+import threading
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+from cachetools import TTLCache
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_CACHE: TTLCache[tuple[str, int], BaseModel] = TTLCache(
+    maxsize=settings.ENTITY_CACHE_MAXSIZE, ttl=settings.ENTITY_CACHE_TTL
+)
+_PAYLOADS: TTLCache[str, bytes] = TTLCache(maxsize=64, ttl=settings.ENTITY_CACHE_TTL)
+_LOCK = threading.Lock()  # rotas `def` rodam no threadpool; TTLCache não é thread-safe
+
+
+def invalidate(entity: str, entity_id: int) -> None:
+    """Remove `(entity, entity_id)` do cache."""
+    with _LOCK:
+        _CACHE.pop((entity, entity_id), None)
+        _PAYLOADS.pop(entity, None)
+
+
+def invalidate_payload(entity: str) -> None:
+    """Descarta a listagem serializada de `entity` (ex.: após um create)."""
+    with _LOCK:
+        _PAYLOADS.pop(entity, None)
+
+
+def clear() -> None:
+    """Esvazia o cache (útil em testes)."""
+    with _LOCK:
+        _CACHE.clear()
+        _PAYLOADS.clear()
+
+
+def cached_payload(entity: str, build: Callable[[], bytes]) -> bytes:
+    """JSON pronto da listagem de `entity`: hit devolve os bytes, miss chama `build`."""
+    with _LOCK:
+        hit = _PAYLOADS.get(entity)
+    if hit is not None:
+        return hit
+    body = build()
+    with _LOCK:
+        _PAYLOADS[entity] = body
+    return body
+
+
+def cached_read(entity: str, schema: type[BaseModel]) -> Callable[[F], F]:
+    """Decora `get(self, id)`: hit devolve o schema cacheado; miss consulta e popula.
+
+    Não encontrado (`None` ou `NoResultFound`, que propaga) não é cacheado.
+    """
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(self: Any, entity_id: int) -> Any:
+            key = (entity, entity_id)
+            with _LOCK:
+                hit = _CACHE.get(key)
+            if hit is not None:
+                return hit
+            obj = func(self, entity_id)
+            if obj is None:
+                return None
+            read = schema.model_validate(obj, from_attributes=True)
+            with _LOCK:
+                _CACHE[key] = read
+            return read
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def invalidate_on_write(entity: str) -> Callable[[F], F]:
+    """Decora escritas `método(self, id, ...)`: invalida a chave (e a listagem) ao final."""
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(self: Any, entity_id: int, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(self, entity_id, *args, **kwargs)
+            finally:
+                invalidate(entity, entity_id)
+        return wrapper  # type: ignore[return-value]
+    return decorator
@@ -5,15 +5,20 @@ import logging
 import os
 import re
 from http import HTTPStatus
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Callable, Dict, List, Optional, TypedDict
 
+import anyio
+import orjson
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
-from sqlalchemy.exc import IntegrityError
+from fastapi.responses import Response
+from sqlalchemy.exc import IntegrityError, NoResultFound, TimeoutError as PoolTimeoutError
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.requests import ClientDisconnect
 from pydantic import BaseModel, ConfigDict
 
+from app.db.session import SessionLocal
+
 logger = logging.getLogger("ppghub.errors")
 
 # ------------------------------------------------------------
@@ -28,6 +33,8 @@ class ProblemDetails(BaseModel):
     """RFC 7807 - application/problem+json.
 
     Campos padronizados. `errors` e `meta` são extensões (permitidas pelo RFC).
+    Documenta o contrato (OpenAPI); em runtime os handlers montam o dict direto
+    (`build_problem`), sem instanciar/validar o modelo no caminho de erro.
     """
     type: str = "about:blank"
     title: str
@@ -39,20 +46,23 @@ class ProblemDetails(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+# Frases padrão dos status HTTP, montadas uma vez no import
+_STATUS_TITLES: Dict[int, str] = {s.value: s.phrase for s in HTTPStatus}
+
 def _status_title(code: int) -> str:
     """Retorna a frase padrão do status HTTP (ex.: 404 -> 'Not Found')."""
-    try:
-        return HTTPStatus(code).phrase
-    except ValueError:
-        return "HTTP Error"
-
-def _problem_response(pd: ProblemDetails) -> JSONResponse:
-    """Gera JSONResponse com o media type correto para Problem+JSON."""
-    return JSONResponse(
-        status_code=pd.status,
-        content=pd.model_dump(exclude_none=True),
-        media_type="application/problem+json",
-    )
+    return _STATUS_TITLES.get(code, "HTTP Error")
+
+class ProblemResponse(Response):
+    """Problem+JSON serializado pelo orjson direto do dict (sem modelo intermediário)."""
+    media_type = "application/problem+json"
+
+    def __init__(self, problem: Dict[str, Any]) -> None:
+        super().__init__(content=orjson.dumps(problem), status_code=problem["status"])
+
+def _problem_response(problem: Dict[str, Any]) -> ProblemResponse:
+    """Gera a resposta Problem+JSON a partir do dict de `build_problem`."""
+    return ProblemResponse(problem)
 
 # ------------------------------------------------------------
 # Helpers de construção de Problem Details
@@ -66,42 +76,45 @@ def build_problem(
     type_url: str | None = None,
     errors: Dict[str, Any] | None = None,
     meta: Dict[str, Any] | None = None,
-) -> ProblemDetails:
-    """Factory para montar ProblemDetails consistente."""
-    return ProblemDetails(
-        type=type_url or "about:blank",
-        title=title or _status_title(status_code),
-        status=status_code,
-        detail=detail,
-        instance=str(request.url),
-        errors=errors,
-        meta={"method": request.method, **(meta or {})},
-    )
+) -> Dict[str, Any]:
+    """Monta o corpo Problem+JSON (campos de `ProblemDetails`), já sem chaves `None`."""
+    problem = {
+        "type": type_url or "about:blank",
+        "title": title or _status_title(status_code),
+        "status": status_code,
+        "detail": detail,
+        "instance": str(request.url),
+        "errors": errors,
+        "meta": {"method": request.method, **(meta or {})},
+    }
+    return {k: v for k, v in problem.items() if v is not None}
 
 # ------------------------------------------------------------
 # Exception Handlers
 # ------------------------------------------------------------
-def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
     """Trata HTTPException (ex.: 404/401/403) em Problem+JSON."""
     # `exc.detail` pode ser str ou dict; use como detail quando for str.
     detail = exc.detail if isinstance(exc.detail, str) else None
     logger.warning("HTTPException %s: %s %s", exc.status_code, request.method, request.url)
-    pd = build_problem(
+    problem = build_problem(
         request=request,
         status_code=exc.status_code,
         detail=detail,
         # `type` opcionalmente poderia apontar para uma doc (ex.: /errors/404)
     )
-    return _problem_response(pd)
+    return _problem_response(problem)
 
-def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+def validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
     """422 de validação Pydantic/FastAPI."""
-    logger.warning("Validation error: %s %s | %s", request.method, request.url, exc.errors())
+    # Só loc/msg/type: o `input` de cada erro (payload inteiro, às vezes) não é
+    # copiado para a resposta nem formatado no log
     items: List[Dict[str, Any]] = [
-        {"loc": e.get("loc"), "msg": e.get("msg"), "type": e.get("type")}
+        {"loc": e["loc"], "msg": e["msg"], "type": e["type"]}  # chaves sempre presentes (v2)
         for e in exc.errors()
     ]
-    pd = build_problem(
+    logger.warning("Validation error: %s %s | %s", request.method, request.url, items)
+    problem = build_problem(
         request=request,
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         title="Unprocessable Entity",
@@ -109,25 +122,40 @@ def validation_exception_handler(request: Request, exc: RequestValidationError)
         type_url="urn:ppghub:errors:validation",
         errors={"items": items},
     )
-    return _problem_response(pd)
+    return _problem_response(problem)
+
+# Regex para extrair campo/valor do erro de unicidade (só roda para 23505)
+# Aceita coluna simples e índice de expressão: "Key (sigla)=" / "Key (lower(codigo::text))="
+_UNIQUE = re.compile(
+    r"Key \((?:\w+\()?(?P<field>\w+)(?:::\w+)?\)?\)=\((?P<value>.+?)\) already exists"
+)
+_UNIQUE_VIOLATION = "23505"
 
-# Regex para extrair campo/valor do erro de unicidade (psycopg2)
-_UNIQUE = re.compile(r"Key \((?P<field>\w+)\)=\((?P<value>.+?)\) already exists")
+def integrity_error_handler(request: Request, exc: IntegrityError) -> Response:
+    """409 para violações de integridade (ex.: unique_violation 23505 no Postgres).
+
+    Rotas/services não capturam IntegrityError: o rollback da sessão do request é feito
+    aqui, e o `SessionLocal.remove()` do `end_request_scope` fica como rede de segurança.
+    """
+    # Sessão do request (scoped_session) fica em estado "failed" após o erro
+    if SessionLocal.registry.has():
+        SessionLocal.rollback()
 
-def integrity_error_handler(request: Request, exc: IntegrityError) -> JSONResponse:
-    """409 para violações de integridade (ex.: unique_violation 23505 no Postgres)."""
     # Evite vazar muita informação; log completo, resposta resumida.
     orig = getattr(exc, "orig", None)
-    pgcode = getattr(orig, "pgcode", None)  # psycopg2: 23505 = unique_violation
-    msg = str(orig) if orig is not None else str(exc)
+    # SQLSTATE: `sqlstate` no psycopg 3, `pgcode` no psycopg2
+    pgcode = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
 
+    # FK/CHECK/NOT NULL não têm hint: sem stringificar o erro nem rodar a regex
     hint: Dict[str, Any] | None = None
-    if m := _UNIQUE.search(msg):
+    if pgcode == _UNIQUE_VIOLATION and (m := _UNIQUE.search(str(orig))):
         hint = {"field": m.group("field"), "value": m.group("value")}
 
-    logger.error("IntegrityError (%s): %s %s | %s", pgcode, request.method, request.url, msg)
+    # `%s` só formata o erro se o registro for de fato emitido
+    cause = orig if orig is not None else exc
+    logger.error("IntegrityError (%s): %s %s | %s", pgcode, request.method, request.url, cause)
 
-    pd = build_problem(
+    problem = build_problem(
         request=request,
         status_code=status.HTTP_409_CONFLICT,
         title="Conflict",
@@ -135,20 +163,122 @@ def integrity_error_handler(request: Request, exc: IntegrityError) -> JSONRespon
         type_url="urn:ppghub:errors:conflict",
         errors={"db_code": pgcode, "hint": hint},
     )
-    return _problem_response(pd)
+    return _problem_response(problem)
 
-def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+def _static_problem_handler(
+    *,
+    status_code: int,
+    title: str,
+    detail: str,
+    type_url: str,
+    log_level: int,
+    log_label: str,
+    headers: Dict[str, str] | None = None,
+) -> Callable[[Request, Exception], Response]:
+    """Handler para erros de corpo fixo (só `instance`/`meta` variam por request)."""
+    def handler(request: Request, exc: Exception) -> Response:
+        logger.log(log_level, "%s: %s %s | %s", log_label, request.method, request.url, exc)
+        problem = build_problem(
+            request=request,
+            status_code=status_code,
+            title=title,
+            detail=detail,
+            type_url=type_url,
+        )
+        response = _problem_response(problem)
+        if headers:
+            response.headers.update(headers)
+        return response
+    return handler
+
+# 404 para `Session.get_one()` / `scalar_one()` sem linha: services não checam `None`
+not_found_handler = _static_problem_handler(
+    status_code=status.HTTP_404_NOT_FOUND,
+    title="Not Found",
+    detail="Recurso não encontrado.",
+    type_url="urn:ppghub:errors:not-found",
+    log_level=logging.WARNING,
+    log_label="NoResultFound",
+)
+
+# 503 quando o pool de conexões esgota (`DB_POOL_TIMEOUT`): o cliente pode tentar de novo
+pool_timeout_handler = _static_problem_handler(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    title="Service Unavailable",
+    detail="Banco de dados ocupado; tente novamente em instantes.",
+    type_url="urn:ppghub:errors:db-pool-exhausted",
+    log_level=logging.ERROR,
+    log_label="Pool de conexões esgotado",
+    headers={"Retry-After": "1"},
+)
+
+# 500 em produção: a parte fixa do corpo é serializada uma vez, no import.
+# Sem o "}" final; `instance` e `meta` são anexados por request (mesma ordem do build_problem).
+_INTERNAL_ERROR_HEAD = orjson.dumps({
+    "type": "urn:ppghub:errors:internal",
+    "title": "Internal Server Error",
+    "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+    "detail": "Ocorreu um erro interno no servidor.",
+})[:-1]
+
+# Cliente desconectou no meio do request: não há a quem responder nem bug a investigar.
+# Tratado no middleware de app/main.py, não em EXCEPTION_HANDLERS: o handler de
+# `Exception` roda dentro do ServerErrorMiddleware do Starlette, que relança a exceção
+# depois dele (e o uvicorn loga o traceback inteiro).
+CLIENT_GONE = (
+    ClientDisconnect,
+    ConnectionResetError,
+    BrokenPipeError,
+    anyio.EndOfStream,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+)
+_CLIENT_CLOSED_REQUEST = 499  # convenção do nginx
+
+def client_gone_response(request: Request, exc: Exception) -> Response:
+    """499 sem corpo nem traceback: a resposta nunca chegaria ao cliente."""
+    logger.debug(
+        "Cliente desconectou: %s %s (%s)", request.method, request.url, type(exc).__name__
+    )
+    return Response(status_code=_CLIENT_CLOSED_REQUEST)
+
+def unhandled_exception_handler(request: Request, exc: Exception) -> Response:
     """500 genérico: não vaza detalhes em produção."""
     logger.exception("Unhandled exception on %s %s", request.method, request.url, exc_info=exc)
 
-    # Em DEBUG podemos expor `detail` (útil no dev); em produção, mensagem neutra.
-    detail = str(exc) if DEBUG else "Ocorreu um erro interno no servidor."
-    pd = build_problem(
+    if not DEBUG:
+        body = b"".join((
+            _INTERNAL_ERROR_HEAD,
+            b',"instance":', orjson.dumps(str(request.url)),
+            b',"meta":', orjson.dumps(
+                {"method": request.method, "request_id": request.headers.get("x-request-id")}
+            ),
+            b"}",
+        ))
+        return Response(
+            body,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            media_type=ProblemResponse.media_type,
+        )
+
+    # Em DEBUG expomos `detail` (útil no dev)
+    problem = build_problem(
         request=request,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         title="Internal Server Error",
-        detail=detail,
+        detail=str(exc),
         type_url="urn:ppghub:errors:internal",
         meta={"request_id": request.headers.get("x-request-id")},
     )
-    return _problem_response(pd)
+    return _problem_response(problem)
+
+# Registro único (exceção -> handler), consumido pelo app em app/main.py.
+# O Starlette resolve pelo MRO da exceção, então `Exception` é só o fallback.
+EXCEPTION_HANDLERS: Dict[type[Exception], Callable[..., Response]] = {
+    StarletteHTTPException: http_exception_handler,
+    RequestValidationError: validation_exception_handler,
+    IntegrityError: integrity_error_handler,
+    NoResultFound: not_found_handler,
+    PoolTimeoutError: pool_timeout_handler,
+    Exception: unhandled_exception_handler,
+}
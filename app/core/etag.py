@@ -0,0 +1,38 @@
+# app/core/etag.py
+"""GET condicional (ETag / If-None-Match) para as listagens paginadas.
+
+O ETag é um hash dos bytes da página já serializada: muda exatamente quando o corpo
+muda (insert, update ou delete que afete a página), sem versão de tabela, sequências
+ou cache de versão que possam responder 304 para um conteúdo que já mudou.
+A consulta e a serialização continuam acontecendo; o 304 economiza a transferência
+(e o parse no cliente) quando nada mudou.
+"""
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request, status
+from fastapi.responses import Response
+
+
+def body_etag(body: bytes) -> str:
+    """ETag forte (entre aspas) do corpo serializado."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    """True se o `If-None-Match` do cliente casa com `etag` (aceita lista, `*` e `W/`)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return "*" in tags or etag in tags
+
+
+def conditional(request: Request, response: Response) -> Response:
+    """Põe o ETag do corpo em `response`; se o cliente já o tem, devolve 304 sem corpo."""
+    etag = body_etag(response.body)
+    if not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
@@ -1,10 +1,54 @@
 # app/core/logging.py
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
 import sys
 
+from app.core.config import settings
+
+# Escrita em stdout numa thread dedicada: `logger.*` nos handlers de erro só enfileira
+_listener: logging.handlers.QueueListener | None = None
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que não formata o registro na thread de quem loga.
+
+    O `prepare` padrão chama `self.format(record)`, que renderiza o traceback de
+    `logger.exception` (o caso caro) ainda no request. Aqui só a mensagem é montada
+    (args resolvidos na hora, antes que objetos mutáveis mudem); `exc_info`/`stack_info`
+    seguem no registro e data/nível/traceback são formatados na thread do listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 def setup_logging():
+    global _listener
+    if _listener is not None:  # idempotente (reload/testes importam o app mais de uma vez)
+        return
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+    )
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)  # drena a fila antes de o processo sair
+
+    # No request só a mensagem é montada; data/nível/logger e tracebacks são formatados na
+    # thread do listener (DeferredQueueHandler não usa formatter)
+    enqueue = DeferredQueueHandler(log_queue)
+
+    # DEBUG só quando settings.DEBUG: em produção, logs de debug (nossos e de libs)
+    # nem chegam a ser formatados/emitidos a cada request
     logging.basicConfig(
-        level=logging.DEBUG,  # 👈 mostra debug, info, warning, error
-        format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
+        level=logging.DEBUG if settings.DEBUG else logging.INFO,
+        handlers=[enqueue],
     )
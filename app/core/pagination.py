@@ -0,0 +1,42 @@
+# app/core/pagination.py
+from __future__ import annotations
+
+import base64
+import binascii
+from collections.abc import Sequence
+from typing import Any, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(last_id: int) -> str:
+    """Codifica o último `id` visto em um cursor opaco (base64 url-safe)."""
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Decodifica o cursor recebido na query string.
+
+    Retorna None quando não há cursor (primeira página).
+    Cursor malformado => 400 (o cliente deve reenviar o `next_cursor` recebido).
+    """
+    if not cursor:
+        return None
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor de paginação inválido.",
+        ) from e
+
+
+def split_page(rows: Sequence[Any], limit: int) -> Tuple[list[Any], Optional[str], bool]:
+    """Recebe até `limit + 1` linhas (keyset) e devolve (items, next_cursor, has_more).
+
+    A linha extra só serve para saber se há próxima página; não é retornada.
+    """
+    has_more = len(rows) > limit
+    items = list(rows[:limit])
+    next_cursor = encode_cursor(items[-1].id) if has_more and items else None
+    return items, next_cursor, has_more
@@ -0,0 +1,90 @@
+# app/core/serialization.py
+"""Conversão ORM -> schema *Read* sem revalidar dados vindos do banco.
+
+Linhas lidas do Postgres já respeitam tipos/constraints; `model_construct` só
+copia os atributos (sem validators), bem mais barato por linha nas listagens.
+Use apenas com schemas de campos escalares cujos nomes batem com as colunas
+(ver tests/test_serialization.py). Campos cujo tipo em runtime não é o da coluna
+(ex.: `HttpUrl`, guardado como str) passam pelo `coerce` de `orm_list`, só nesses
+valores; o resto da linha segue sem validação. Desligável via `FAST_ORM_SCHEMA`.
+
+No sentido inverso, `to_model_kwargs` monta os kwargs de escrita sem `model_dump`.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Mapping, TypeVar
+
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.config import settings
+
+S = TypeVar("S", bound=BaseModel)
+
+
+def schema_fields(schema_cls: type[BaseModel]) -> tuple[str, ...]:
+    """Campos do schema (calcule uma vez, no import do módulo)."""
+    return tuple(schema_cls.model_fields)
+
+
+def from_orm_fast(
+    schema_cls: type[S],
+    obj: Any,
+    fields: tuple[str, ...],
+    coerce: Mapping[str, Callable[[Any], Any]] | None = None,
+) -> S:
+    """ORM -> schema sem validação (dados de dentro da fronteira de confiança).
+
+    `coerce` converte só os campos indicados (valores não nulos) para o tipo do schema.
+    """
+    data = {f: getattr(obj, f) for f in fields}
+    if coerce:
+        for field, convert in coerce.items():
+            if data[field] is not None:
+                data[field] = convert(data[field])
+    return schema_cls.model_construct(**data)
+
+
+def orm_list(
+    schema_cls: type[S],
+    rows: Iterable[Any],
+    *,
+    fields: tuple[str, ...],
+    adapter: TypeAdapter[list[S]],
+    coerce: Mapping[str, Callable[[Any], Any]] | None = None,
+) -> list[S]:
+    """Converte uma página de linhas ORM; com a flag desligada, valida pelo adapter."""
+    if settings.FAST_ORM_SCHEMA:
+        return [from_orm_fast(schema_cls, row, fields, coerce) for row in rows]
+    return adapter.validate_python(rows, from_attributes=True)
+
+
+def to_model_kwargs(payload: BaseModel, *, only_set: bool = False) -> dict[str, Any]:
+    """Payload -> kwargs do modelo ORM, lendo os atributos direto (sem `model_dump`).
+
+    Equivale a `model_dump()` / `model_dump(exclude_unset=True)` para schemas de
+    entrada "rasos" (campos escalares/dict, sem submodelos), que é o caso das
+    entidades daqui. `only_set=True` mantém o tri-estado de PATCH.
+    """
+    fields = payload.model_fields_set if only_set else type(payload).model_fields
+    return {f: getattr(payload, f) for f in fields}
+
+
+def json_response(
+    content: BaseModel | list[Any],
+    *,
+    adapter: TypeAdapter[Any] | None = None,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Resposta JSON serializada direto pelo serializer (Rust) do pydantic.
+
+    Sem dict intermediário (`model_dump`), sem `jsonable_encoder` e sem revalidação: o
+    conteúdo já é o schema *Read* montado pelo service/`orm_list`. Como a rota devolve um
+    `Response`, o FastAPI não aplica `response_model`; declare o schema em
+    `responses={200: {"model": ...}}`, que só documenta o corpo no OpenAPI (o teste em
+    tests/test_serialization.py checa que esses bytes validam contra ele).
+    Listas soltas pedem o `adapter`.
+    """
+    body = adapter.dump_json(content) if adapter is not None else content.model_dump_json()
+    return Response(body, status_code=status_code, media_type="application/json", headers=headers)
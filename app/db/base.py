@@ -1,6 +1,11 @@
 from __future__ import annotations
+from typing import Any
+
+from sqlalchemy import Connection, text
 from sqlalchemy.orm import DeclarativeBase
 
+from app.core.config import settings
+
 # IMPORTANTE: importe todos os models aqui para registrá-los no registry.
 # Não coloque dentro de funções; deixe no nível do módulo.
 
@@ -8,6 +13,22 @@ class Base(DeclarativeBase):
     """Classe base para todos os modelos ORM."""
     pass
 
+# Estratégia padrão dos relacionamentos que nenhuma rota deveria carregar sob demanda.
+# Com ORM_STRICT_LOADING (dev/CI), um lazy-load esquecido (N+1) vira InvalidRequestError;
+# carregue com selectinload/joinedload quando precisar do relacionamento.
+DEFAULT_LAZY = "raise_on_sql" if settings.ORM_STRICT_LOADING else "select"
+
+
+def has_pg_trgm(ddl: Any, target: Any, bind: Connection | None, **kw: Any) -> bool:
+    """`ddl_if` dos índices `gin_trgm_ops`: só os cria se a extensão pg_trgm existir.
+
+    A extensão é pré-requisito de provisionamento (ver `init_db`); sem ela o create_all
+    segue sem esses índices em vez de derrubar o startup.
+    """
+    if bind is None:  # DDL só renderizada como texto (sem banco para consultar)
+        return True
+    return bind.scalar(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")) is not None
+
 # # fmt: off
 # from app.models.instituicao import Instituicao     # noqa: F401
 # from app.models.programa import Programa           # noqa: F401
@@ -1,32 +1,129 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+import itertools
+import logging
+from contextvars import ContextVar, Token
+from typing import Optional
+
+import orjson
+from sqlalchemy import Connection, create_engine, make_url, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import scoped_session, sessionmaker
 from app.core.config import settings
 from app.db.base import Base# importa da central de dependências
 
 
+# URL parseada uma vez e compartilhada pelos engines (DATABASE_URL já é str simples)
+_url = make_url(settings.DATABASE_URL)
+
+# TCP keepalives da libpq (psycopg2 e psycopg 3): conexões ociosas mortas caem pelo
+# kernel; o pool_pre_ping (DB_POOL_PRE_PING) cobre as derrubadas entre dois checkouts
+_connect_args: dict = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 5,
+}
+# `prepare_threshold` é opção do psycopg 3; outros drivers (psycopg2) a rejeitariam
+if _url.get_driver_name() == "psycopg":
+    _connect_args["prepare_threshold"] = settings.DB_PREPARE_THRESHOLD
+
+# Colunas JSON/JSONB (endereco, configuracoes, permissoes...) via orjson nos dois sentidos.
+# psycopg 3 aceita bytes do dumps; o psycopg2 exige str.
+if _url.get_driver_name() == "psycopg":
+    _json_dumps = orjson.dumps
+else:
+    def _json_dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
 # Engine para o banco Postgres
 engine = create_engine(
-    settings.DATABASE_URL,
+    _url,
+    echo=False,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    # LIFO: reusa sempre as conexões mais recentes (quentes, com prepared statements);
+    # as ociosas no fundo da fila expiram via pool_recycle
+    pool_use_lifo=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+    connect_args=_connect_args,
+    future=True,)
+
+# Engine mínimo só para probes (/readyz): health checks não disputam o pool da aplicação
+probe_engine = create_engine(
+    _url,
     echo=False,
+    pool_size=1,
+    max_overflow=1,
+    pool_recycle=settings.DB_POOL_RECYCLE,
     pool_pre_ping=True,
     future=True,)
 
-# Factory para criar sessões
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-    expire_on_commit=False,
-    future=True,
+# Escopo da sessão = request atual (preenchido pelo middleware em app/main.py).
+# Fora de um request (scripts, testes) o escopo é None e a sessão é compartilhada.
+_request_scope: ContextVar[Optional[int]] = ContextVar("db_request_scope", default=None)
+_scope_ids = itertools.count(1)
+
+# Factory de sessões: uma Session por request, reutilizada por todas as dependências
+SessionLocal = scoped_session(
+    sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=engine,
+        expire_on_commit=False,
+        future=True,
+    ),
+    scopefunc=_request_scope.get,
 )
 
+def begin_request_scope() -> Token:
+    """Abre um escopo de sessão para o request corrente."""
+    return _request_scope.set(next(_scope_ids))
+
+def end_request_scope(token: Token) -> None:
+    """Fecha a sessão do request (devolve a conexão ao pool) e encerra o escopo."""
+    try:
+        SessionLocal.remove()
+    finally:
+        _request_scope.reset(token)
+
+logger = logging.getLogger("ppghub.db")
+
+# Chave do advisory lock que serializa o DDL de startup entre os workers
+_INIT_DB_LOCK_KEY = 0x70706768  # "ppgh"
+
 def init_db():
     """
     Inicializa schemas e tabelas no banco.
+
+    Com `uvicorn --workers N` cada worker chama isto no startup. O advisory lock
+    (liberado no fim da transação) é bloqueante: um worker roda o DDL e os outros esperam;
+    ao obterem o lock, tudo já existe e o create_all deles não emite DDL. Assim nenhum
+    worker atende requests antes de schemas e tabelas existirem.
     """
     with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:k)"), {"k": _INIT_DB_LOCK_KEY})
         conn.execute(text("CREATE SCHEMA IF NOT EXISTS auth"))
         conn.execute(text("CREATE SCHEMA IF NOT EXISTS core"))
+        _ensure_pg_trgm(conn)
+        Base.metadata.create_all(bind=conn)
 
-    Base.metadata.create_all(bind=engine)
+def _ensure_pg_trgm(conn: Connection) -> None:
+    """Garante a extensão pg_trgm (gin_trgm_ops dos índices de busca), se o papel puder.
 
+    CREATE EXTENSION exige privilégio de CREATE no banco; em Postgres gerenciado o papel
+    da aplicação costuma não ter. Nesse caso a extensão é pré-requisito de provisionamento
+    (revisão Alembic 0004, aplicada por um papel com privilégio): o startup só avisa e
+    o create_all pula os índices de trigramas (`has_pg_trgm` em app/db/base.py).
+    """
+    try:
+        with conn.begin_nested():  # SAVEPOINT: a falha não aborta a transação do DDL
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except DBAPIError as exc:
+        logger.warning(
+            "Extensão pg_trgm indisponível (%s); índices de trigramas não serão criados",
+            exc.orig,
+        )
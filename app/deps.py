@@ -1,21 +1,45 @@
 # app/deps.py
-from collections.abc import Generator
 from sqlalchemy.orm import Session
 from fastapi import Depends
 
 from app.db.session import SessionLocal
+from app.services.docente_service import DocenteService
+from app.services.instituicao_service import InstituicaoService
+from app.services.programa_service import ProgramaService
 from app.services.role_service import RoleService
+from app.services.usuario_programa_role_service import UsuarioProgramaRoleService
+from app.services.usuario_service import UsuarioService
 
-def get_db() -> Generator[Session, None, None]:
-    """Sessão por request: abre/fecha corretamente."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+def get_db() -> Session:
+    """Sessão por request (scoped_session).
+
+    O fechamento fica a cargo do middleware `db_session_scope` (SessionLocal.remove()),
+    que roda ao fim de cada request mesmo quando várias dependências usam a sessão.
+    Função comum, não generator: sem contexto de saída para o FastAPI abrir/fechar.
+    """
+    return SessionLocal()
+
+# ----------------- SERVICES -----------------
+# Sub-dependências: o FastAPI resolve cada uma uma vez por request (cache de Depends)
+# e os handlers recebem o service pronto. Também facilita `app.dependency_overrides` nos testes.
+
+def get_instituicao_service(db: Session = Depends(get_db)) -> InstituicaoService:
+    return InstituicaoService(db)
+
+def get_docente_service(db: Session = Depends(get_db)) -> DocenteService:
+    return DocenteService(db)
+
+def get_programa_service(db: Session = Depends(get_db)) -> ProgramaService:
+    return ProgramaService(db)
 
 def get_role_service(db: Session = Depends(get_db)) -> RoleService:
     return RoleService(db)
 
+def get_usuario_service(db: Session = Depends(get_db)) -> UsuarioService:
+    return UsuarioService(db)
+
+def get_usuario_programa_role_service(db: Session = Depends(get_db)) -> UsuarioProgramaRoleService:
+    return UsuarioProgramaRoleService(db)
+
 # alias para compatibilidade
 get_session = get_db
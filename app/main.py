@@ -1,42 +1,59 @@
 from __future__ import annotations
-import datetime, socket
-import time
-from fastapi import FastAPI
-from sqlalchemy.exc import IntegrityError
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+import anyio
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 from app.api.routes import programas
 from app.api.routes.instituicoes import router as instituicoes_router
 from app.api.routes.roles import router as roles_router
 from app.api.routes.docentes import router as docentes_router
 from app.api.routes.usuarios import router as usuarios_router
-from fastapi.exceptions import RequestValidationError
-from starlette.exceptions import HTTPException as StarletteHTTPException
-from fastapi import Depends
-from sqlalchemy.orm import Session
+from app.api.routes.monitoring import router as monitoring_router
 from app.core.config import settings
-from app.deps import get_session, get_db
-from app.db.session import init_db
-import socket
-from sqlalchemy import text
-from app.core.errors import (
-    http_exception_handler,
-    validation_exception_handler,
-    integrity_error_handler,
-    unhandled_exception_handler,
-)
+from app.db.session import init_db, begin_request_scope, end_request_scope
+from app.core.errors import CLIENT_GONE, EXCEPTION_HANDLERS, client_gone_response
 from app.core.logging import setup_logging
 import app.models
 
 setup_logging()
 
-app = FastAPI(title="PPGHUB API", version="0.1.0")
 
-# Handlers específicos
-app.add_exception_handler(StarletteHTTPException, http_exception_handler)
-app.add_exception_handler(RequestValidationError, validation_exception_handler)
-app.add_exception_handler(IntegrityError, integrity_error_handler)
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    if settings.DB_CREATE_ALL_ON_STARTUP:
+        init_db()
+    # As rotas com banco são `def` (SQLAlchemy síncrono) e rodam no threadpool do anyio;
+    # com o limite padrão (40) a concorrência travaria antes do pool de conexões.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    yield
+
+
+# Handlers RFC 7807 (específicos + fallback `Exception`): tabela em app/core/errors.py
+app = FastAPI(
+    title="PPGHUB API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    exception_handlers=EXCEPTION_HANDLERS,
+    lifespan=lifespan,
+)
+
 
-# Fallback genérico (sempre por último)
-app.add_exception_handler(Exception, unhandled_exception_handler)
+# Uma Session (scoped_session) por request; removida ao final para devolver a conexão ao pool.
+# Cliente que desconectou vira 499 aqui, antes do ServerErrorMiddleware (que logaria o
+# traceback e relançaria a exceção).
+@app.middleware("http")
+async def db_session_scope(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    token = begin_request_scope()
+    try:
+        return await call_next(request)
+    except CLIENT_GONE as exc:
+        return client_gone_response(request, exc)
+    finally:
+        end_request_scope(token)
 
 
 
@@ -46,92 +63,18 @@ app.include_router(roles_router)
 app.include_router(usuarios_router)
 app.include_router(programas.router)
 app.include_router(docentes_router)
-
-@app.on_event("startup")
-def on_startup():
-    init_db()
+app.include_router(monitoring_router)
 
 # rota raiz
 @app.get("/")
 async def root():
     return {"message": "Bem-vindo à API do PPG Hub!"}
 
-@app.get("/healthzzzz")
-def healthz() -> dict[str, str]:
-    return {"status": "ok"}
-
-@app.get("/ping")
-def ping():
-    return {"pong": True}
-
-
-@app.get("/routers-ping", tags=["monitoring"])
-def routers_ping() -> dict:
-    """
-    Lista todas as rotas registradas no FastAPI.
-    Útil para verificar se os routers foram incluídos corretamente.
-    """
-    routers_info = []
-    for route in app.routes:
-        if hasattr(route, "methods"):
-            routers_info.append({
-                "path": route.path,
-                "methods": list(route.methods),
-                "name": route.name,
-            })
-
-    return {
-        "total_routes": len(routers_info),
-        "routers": routers_info
-    }
-
-
-
-@app.get("/testdb")
-def test_db(db: Session = Depends(get_db)):
-    return {"ok": str(db.execute("SELECT 1").scalar())}
-@app.get("/hp", tags=["monitoring"])
-def health_plus(db: Session = Depends(get_session)) -> dict:
-    """
-    Health check avançado:
-    - Status da aplicação
-    - Conexão e tempo de resposta do banco
-    - Schemas disponíveis
-    - Ambiente e versão da aplicação
-    """
-    health = {
-        "app_status": "ok",
-        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
-        "hostname": socket.gethostname(),
-        "environment": settings.ENVIRONMENT,
-        "database": {},
-    }
-
-    # Testa conexão com o banco e mede latência
-    try:
-        start = time.perf_counter()
-        db.execute(text("SELECT 1"))
-        latency = (time.perf_counter() - start) * 1000  # ms
-        health["database"]["status"] = "connected"
-        health["database"]["latency_ms"] = round(latency, 2)
-
-        # Lista schemas disponíveis
-        result = db.execute(
-            text("SELECT schema_name FROM information_schema.schemata;")
-        )
-        schemas = [row[0] for row in result]
-        health["database"]["schemas"] = schemas
-
-        # Valida se os schemas críticos existem
-        required = {"auth", "core", "academic"}
-        missing = list(required - set(schemas))
-        health["database"]["required_schemas_ok"] = not missing
-        if missing:
-            health["database"]["missing_schemas"] = missing
-
-    except Exception as e:
-        health["database"]["status"] = "error"
-        health["database"]["detail"] = str(e)
 
-    return health
+# python -m app.main (produção: uvicorn app.main:app --loop uvloop --http httptools)
+if __name__ == "__main__":
+    import uvicorn
 
+    # uvicorn[standard] já instala uvloop + httptools; fixá-los faz a ausência falhar alto
+    # em vez de cair silenciosamente no asyncio/h11 puros.
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
@@ -9,15 +9,18 @@ from sqlalchemy import (
     Integer,
     Boolean,
     Date,
+    DateTime,
     Text,
     ForeignKey,
     CheckConstraint,
+    Index,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, DEFAULT_LAZY, has_pg_trgm
 
 
 class Docente(Base):
@@ -35,6 +38,24 @@ class Docente(Base):
             "data_desvinculacao IS NULL OR data_desvinculacao >= data_vinculacao",
             name="ck_docente_datas",
         ),
+        # FKs sem índice viram seq scan em docentes a cada DELETE/UPDATE de programa ou
+        # linha. (programa_id, status) também atende "docentes ativos de um programa".
+        # usuario_id já é prefixo de uq_docente_usuario_programa.
+        Index("ix_docentes_programa_status", "programa_id", "status"),
+        # Parcial: docentes sem linha (NULL) ficam fora da btree; `= :id` (e o FK) seguem nele
+        Index(
+            "ix_docentes_linha_pesquisa",
+            "linha_pesquisa_id",
+            postgresql_where=text("linha_pesquisa_id IS NOT NULL"),
+        ),
+        # Trigramas (pg_trgm): ILIKE '%termo%' em areas_interesse vira busca no índice GIN
+        # em vez de seq scan. Pulado se a extensão não existir (has_pg_trgm)
+        Index(
+            "ix_docentes_areas_interesse_trgm",
+            "areas_interesse",
+            postgresql_using="gin",
+            postgresql_ops={"areas_interesse": "gin_trgm_ops"},
+        ).ddl_if(callable_=has_pg_trgm),
         {"schema": "academic"},  # ✅ sempre por último
     )
 
@@ -90,11 +111,16 @@ class Docente(Base):
     status: Mapped[str] = mapped_column(String(50), default="Ativo")
     motivo_desligamento: Mapped[Optional[str]] = mapped_column(Text)
 
-    # Auditoria
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now())
+    # Auditoria: timestamptz com DEFAULT now() no banco, como nos demais modelos
+    # (bancos antigos: revisões Alembic 0001 e 0005)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
 
     # Relações ORM
-    usuario = relationship("Usuario", back_populates="docentes")
-    programa = relationship("Programa", back_populates="docentes")
+    usuario = relationship("Usuario", back_populates="docentes", lazy=DEFAULT_LAZY)
+    programa = relationship("Programa", back_populates="docentes", lazy=DEFAULT_LAZY)
     # linha_pesquisa = relationship("LinhaPesquisa", back_populates="docentes") TODO: implementar linha de pesquisa futuramente
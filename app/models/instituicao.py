@@ -1,6 +1,7 @@
 from __future__ import annotations
 from datetime import datetime
-from sqlalchemy import String, Boolean, DateTime, JSON, UniqueConstraint
+from sqlalchemy import String, Boolean, DateTime, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
@@ -9,24 +10,24 @@ class Instituicao(Base):
     """Modelo ORM para a tabela core.instituicoes."""
 
     __tablename__ = "instituicoes"
-    __table_args__ = (
-        UniqueConstraint("codigo", name="uq_instituicao_codigo"),
-        UniqueConstraint("sigla", name="uq_instituicao_sigla"),
-        {"schema": "core"},
-    )
+    # Unicidade de codigo/sigla: índices únicos em lower(...) definidos após a classe
+    __table_args__ = {"schema": "core"}
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    codigo: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)  # PK já é indexada pelo Postgres
+    codigo: Mapped[str] = mapped_column(String(20), nullable=False)
     nome_completo: Mapped[str] = mapped_column(String(500), nullable=False)
     nome_abreviado: Mapped[str] = mapped_column(String(50), nullable=False)
-    sigla: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
+    sigla: Mapped[str] = mapped_column(String(10), nullable=False)
     tipo: Mapped[str] = mapped_column(String(50), nullable=False)
-    cnpj: Mapped[str | None] = mapped_column(String(20))
+    # só dígitos (ver schemas); bancos antigos: revisão Alembic 0002
+    cnpj: Mapped[str | None] = mapped_column(String(14))
     natureza_juridica: Mapped[str | None] = mapped_column(String(100))
 
-    endereco: Mapped[dict | None] = mapped_column(JSON, default={})
-    contatos: Mapped[dict | None] = mapped_column(JSON, default={})
-    redes_sociais: Mapped[dict | None] = mapped_column(JSON, default={})
+    # JSONB (binário): sem reparse do texto a cada leitura; operadores @>/? disponíveis.
+    # '{}' preenchido pelo Postgres quando o INSERT omite a coluna (como em Programa)
+    endereco: Mapped[dict | None] = mapped_column(JSONB, server_default="{}")
+    contatos: Mapped[dict | None] = mapped_column(JSONB, server_default="{}")
+    redes_sociais: Mapped[dict | None] = mapped_column(JSONB, server_default="{}")
 
     logo_url: Mapped[str | None] = mapped_column(String(255))
     website: Mapped[str | None] = mapped_column(String(255))
@@ -35,7 +36,22 @@ class Instituicao(Base):
     ror_id: Mapped[str | None] = mapped_column(String(50))
 
     ativo: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    configuracoes: Mapped[dict | None] = mapped_column(JSON, default={})
+    configuracoes: Mapped[dict | None] = mapped_column(JSONB, server_default="{}")
+
+    # Preenchidos pelo Postgres (timestamptz com now(), como nos demais modelos): o INSERT
+    # não leva esses parâmetros e cargas em lote (multi-VALUES/COPY) não precisam informá-los.
+    # Bancos antigos: revisões Alembic 0001 (DEFAULT) e 0005 (timestamptz)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+# Case-insensitive no próprio banco: "UEPB" e "uepb" colidem mesmo em cargas que não
+# passam pela API (OpenAlex/ROR). Substituem os UNIQUE simples e os `index=True`
+# redundantes (cada um era um segundo índice sobre a mesma coluna). Bancos criados antes
+# dessa troca: revisão Alembic 0003 (migrations/versions/).
+Index("uq_instituicao_codigo_ci", func.lower(Instituicao.codigo), unique=True)
+Index("uq_instituicao_sigla_ci", func.lower(Instituicao.sigla), unique=True)
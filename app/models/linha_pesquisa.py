@@ -1,13 +1,23 @@
 # app/models/linha_pesquisa.py
 from __future__ import annotations
-from sqlalchemy import Integer, String, Text, ForeignKey
+from sqlalchemy import Integer, String, Text, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.base import Base
+from app.db.base import Base, has_pg_trgm
 
 class LinhaPesquisa(Base):
     """ORM para core.linhas_pesquisa."""
     __tablename__ = "linhas_pesquisa"
-    __table_args__ = {"schema": "core"}  # ✅ importante
+    __table_args__ = (
+        # Trigramas (pg_trgm): ILIKE '%termo%' em palavras_chave usa o índice GIN em vez
+        # de seq scan. Pulado se a extensão não existir (has_pg_trgm)
+        Index(
+            "ix_linhas_pesquisa_palavras_chave_trgm",
+            "palavras_chave",
+            postgresql_using="gin",
+            postgresql_ops={"palavras_chave": "gin_trgm_ops"},
+        ).ddl_if(callable_=has_pg_trgm),
+        {"schema": "core"},  # ✅ importante
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     programa_id: Mapped[int] = mapped_column(
@@ -10,9 +10,8 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.ext.mutable import MutableDict  # <- rastrear mutações em JSONB
 
-from app.db.base import Base
+from app.db.base import Base, DEFAULT_LAZY
 
 
 class Programa(Base):
@@ -21,7 +20,8 @@ class Programa(Base):
     Regras:
       - (instituicao_id, sigla) é único por schema.
       - conceito_capes ∈ [1,7] quando não nulo.
-      - JSONB 'configuracoes' é mutável (mudanças in-place são rastreadas).
+      - JSONB 'configuracoes' carrega como dict comum: mudanças in-place NÃO são
+        rastreadas; reatribua o campo ou chame `flag_modified(programa, "configuracoes")`.
     """
     __tablename__ = "programas"
     __table_args__ = (
@@ -45,7 +45,7 @@ class Programa(Base):
     )
 
     # Dentro da classe Programa
-    docentes = relationship("Docente", back_populates="programa")
+    docentes = relationship("Docente", back_populates="programa", lazy=DEFAULT_LAZY)
 
     # Identificação acadêmica
     codigo_capes: Mapped[Optional[str]] = mapped_column(
@@ -80,7 +80,7 @@ class Programa(Base):
 
     # Configuração / governança
     configuracoes: Mapped[dict] = mapped_column(
-        MutableDict.as_mutable(JSONB),  # <- essencial para tracking
+        JSONB,  # sem proxy MutableDict por linha carregada (ver docstring)
         nullable=False,
         server_default="{}",
         doc="Configurações dinâmicas do Programa (JSONB).",
@@ -103,6 +103,7 @@ class Programa(Base):
         back_populates="programa",
         cascade="all, delete-orphan",
         passive_deletes=True,
+        lazy=DEFAULT_LAZY,
     )
 
     # (Opcional) Ajuda no debug
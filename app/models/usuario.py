@@ -15,7 +15,7 @@ class Usuario(Base):
     __table_args__ = {'schema': 'auth'}
 
     # PK
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)  # PK já é indexada
 
     programas_roles = relationship(
         "UsuarioProgramaRole",
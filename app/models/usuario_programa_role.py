@@ -10,8 +10,10 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     CheckConstraint,
+    Index,
     UniqueConstraint,
     Text,
+    func,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -20,7 +22,7 @@ from app.db.base import Base
 
 class UsuarioProgramaRole(Base):
     """
-    ORM para a tabela auth.usuario_programa_roles.
+    ORM para a tabela auth.usuarios_programas (único mapeamento dessa tabela).
     Representa o vínculo de um usuário com um programa e seu papel (role),
     incluindo status e histórico de datas.
     """
@@ -35,11 +37,26 @@ class UsuarioProgramaRole(Base):
             "data_desvinculacao IS NULL OR data_desvinculacao >= data_vinculacao",
             name="ck_datas_vinculo",
         ),
+        # "vínculos ativos do usuário/programa": index-only scan (INCLUDE traz os ids).
+        # O de programa também indexa a FK (CASCADE ao remover um programa).
+        Index(
+            "ix_upr_usuario_status",
+            "usuario_id",
+            "status",
+            postgresql_include=["role_id", "programa_id"],
+        ),
+        Index(
+            "ix_upr_programa_status",
+            "programa_id",
+            "status",
+            postgresql_include=["role_id", "usuario_id"],
+        ),
         {"schema": "auth"},
     )
 
     # ----------------- COLUNAS -----------------
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, index=True)
+    # PK já é indexada
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
     # FKs principais
     usuario_id: Mapped[int] = mapped_column(
@@ -67,7 +84,9 @@ class UsuarioProgramaRole(Base):
     observacoes: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Auditoria
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     created_by: Mapped[int | None] = mapped_column(
         Integer,
         ForeignKey("auth.usuarios.id"),
@@ -1,8 +1,8 @@
 # app/repositories/docente_repo.py
 from typing import Mapping, Any
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import select, func, delete, insert
 from app.models.docente import Docente
 
 class DocenteRepository:
@@ -12,17 +12,28 @@ class DocenteRepository:
         self.db = db
 
     def create(self, payload: dict) -> Docente:
-        docente = Docente(**payload)
-        self.db.add(docente)
-        self.db.flush()
-        return docente
+        """INSERT ... RETURNING: timestamps do banco já vêm na entidade (sem commit)."""
+        return self.db.scalars(insert(Docente).values(**payload).returning(Docente)).one()
+
+    def create_many(self, payloads: list[dict]) -> list[Docente]:
+        """INSERT em lote (insertmanyvalues do SQLAlchemy 2): VALUES multi-linha + RETURNING,
+        sem commit."""
+        return list(self.db.scalars(insert(Docente).returning(Docente), payloads).all())
 
     def get(self, docente_id: int) -> Docente | None:
         return self.db.get(Docente, docente_id)
 
-    def list(self, skip: int = 0, limit: int = 10) -> list[Docente]:
-        stmt = select(Docente).offset(skip).limit(limit)
-        return list(self.db.scalars(stmt).all())
+    def list(self, limit: int = 10, after_id: int | None = None) -> list[Docente]:
+        """Keyset: até `limit + 1` docentes com `id > after_id` (a linha extra indica has_more).
+
+        DocenteRead não expõe `usuario`/`programa`: a página deve custar UMA query.
+        `raiseload` transforma qualquer lazy-load acidental (N+1) em erro; se um schema
+        passar a expor relacionamento, troque por `selectinload(Docente.<rel>)` aqui.
+        """
+        stmt = select(Docente).options(raiseload("*", sql_only=True)).order_by(Docente.id)
+        if after_id is not None:
+            stmt = stmt.where(Docente.id > after_id)
+        return list(self.db.scalars(stmt.limit(limit + 1)).all())
 
     def count(self) -> int:
         stmt = select(func.count()).select_from(Docente)
@@ -37,8 +48,6 @@ class DocenteRepository:
         return docente
 
     def delete(self, docente_id: int) -> bool:
-        docente = self.get(docente_id)
-        if not docente:
-            return False
-        self.db.delete(docente)
-        return True
+        """DELETE ... RETURNING id: existência + remoção num único round-trip (sem commit)."""
+        stmt = delete(Docente).where(Docente.id == docente_id).returning(Docente.id)
+        return self.db.execute(stmt).first() is not None
@@ -2,9 +2,15 @@
 from __future__ import annotations  # <- evita avaliar tipos em runtime
 from collections.abc import Mapping  # <- preferível em 3.9+
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import Row, select, delete, insert
 from app.models.instituicao import Instituicao
-from app.deps import get_db
+
+# Colunas do InstituicaoRead: a listagem não traz created_at/updated_at nem monta entidades
+_LIST_COLUMNS = tuple(
+    getattr(Instituicao, c.key)
+    for c in Instituicao.__table__.columns
+    if c.key not in {"created_at", "updated_at"}
+)
 
 
 
@@ -15,20 +21,23 @@ class InstituicaoRepository:
         self.db = db
 
     def create(self, data: dict) -> Instituicao:
-        obj = Instituicao(**data)
-        self.db.add(obj)
+        # INSERT ... RETURNING: defaults do banco (timestamps, JSONB) voltam junto, sem refresh
+        obj = self.db.scalars(insert(Instituicao).values(**data).returning(Instituicao)).one()
         self.db.commit()
-        self.db.refresh(obj)
         return obj
 
     def get(self, instituicao_id: int) -> Instituicao | None:
         return self.db.get(Instituicao, instituicao_id)
 
-    def list(self, limit: int = 10, offset: int = 0) -> tuple[list[Instituicao], int]:
-        stmt = select(Instituicao).offset(offset).limit(limit)
-        items = self.db.scalars(stmt).all()
-        total = self.db.scalar(select(func.count()).select_from(Instituicao))
-        return items, total
+    def list(self, limit: int = 10, after_id: int | None = None) -> list[Row]:
+        """Keyset: `WHERE id > :after_id ORDER BY id LIMIT :limit + 1` (linha extra => has_more).
+
+        Retorna `Row`s com as colunas de `_LIST_COLUMNS` (sem materializar entidades ORM).
+        """
+        stmt = select(*_LIST_COLUMNS).order_by(Instituicao.id)
+        if after_id is not None:
+            stmt = stmt.where(Instituicao.id > after_id)
+        return list(self.db.execute(stmt.limit(limit + 1)).all())
 
     # def update(self, instituicao_id: int, data: dict) -> Instituicao | None:
     #     obj = self.get(instituicao_id)
@@ -69,9 +78,8 @@ class InstituicaoRepository:
         return obj
 
     def delete(self, instituicao_id: int) -> bool:
-        obj = self.get(instituicao_id)
-        if not obj:
-            return False
-        self.db.delete(obj)
+        # DELETE ... RETURNING: checa existência e remove num único round-trip
+        stmt = delete(Instituicao).where(Instituicao.id == instituicao_id).returning(Instituicao.id)
+        deleted = self.db.execute(stmt).first() is not None
         self.db.commit()
-        return True
+        return deleted
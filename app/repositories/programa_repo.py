@@ -1,7 +1,7 @@
 from __future__ import annotations
-from typing import Optional, Tuple, List
-from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from typing import Optional, List
+from sqlalchemy import select, update, delete, insert
+from sqlalchemy.orm import Session, raiseload
 from app.models.programa import Programa
 
 
@@ -13,11 +13,9 @@ class ProgramaRepository:
 
     # ----------------- CREATE -----------------
     def create(self, data: dict) -> Programa:
-        """Cria um novo programa."""
-        obj = Programa(**data)
-        self.session.add(obj)
+        """Cria um novo programa com `INSERT ... RETURNING` (defaults do banco sem refresh)."""
+        obj = self.session.scalars(insert(Programa).values(**data).returning(Programa)).one()
         self.session.commit()
-        self.session.refresh(obj)
         return obj
 
     # ----------------- READ -----------------
@@ -25,16 +23,16 @@ class ProgramaRepository:
         """Busca programa por ID."""
         return self.session.get(Programa, programa_id)
 
-    def list(self, limit: int = 50, offset: int = 0) -> Tuple[List[Programa], int]:
+    def list(self, limit: int = 50, after_id: Optional[int] = None) -> List[Programa]:
         """
-        Lista programas com paginação.
-        Retorna (items, total).
+        Lista programas com paginação por cursor (keyset).
+        Retorna até `limit + 1` linhas: a extra indica que há próxima página.
+        ProgramaRead não usa `docentes`/`usuarios_roles`: `raiseload` impede N+1 silencioso.
         """
-        stmt = select(Programa).offset(offset).limit(limit)
-        items = self.session.scalars(stmt).all()
-
-        total = self.session.scalar(select(func.count()).select_from(Programa))
-        return items, total
+        stmt = select(Programa).options(raiseload("*", sql_only=True)).order_by(Programa.id)
+        if after_id is not None:
+            stmt = stmt.where(Programa.id > after_id)
+        return list(self.session.scalars(stmt.limit(limit + 1)).all())
 
     def list_all(self) -> List[Programa]:
         """Lista todos os programas sem paginação."""
@@ -60,14 +58,14 @@ class ProgramaRepository:
         Remove um programa.
         - hard=True → exclusão física
         - hard=False → soft delete (status='Inativo'), se o modelo tiver esse campo
+        Um único `... RETURNING id` (sem SELECT prévio): nenhuma linha -> False.
         """
-        obj = self.get(programa_id)
-        if not obj:
-            return False
-
-        if hard or not hasattr(obj, "ativo"):
-            self.session.delete(obj)
+        if hard or not hasattr(Programa, "ativo"):
+            stmt = delete(Programa).returning(Programa.id)
         else:
-            obj.ativo = False  # só se existir esse campo no modelo
+            # só se existir esse campo no modelo
+            stmt = update(Programa).values(ativo=False).returning(Programa.id)
+        stmt = stmt.where(Programa.id == programa_id)
+        found = self.session.execute(stmt).first() is not None
         self.session.commit()
-        return True
+        return found
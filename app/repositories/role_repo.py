@@ -2,11 +2,16 @@
 from __future__ import annotations
 
 from typing import Optional, Tuple, Iterable, List
-from sqlalchemy import select, func, update as sa_update, delete as sa_delete
+from sqlalchemy import Row, select, func, insert, update as sa_update, delete as sa_delete
 from sqlalchemy.orm import Session
 
 from app.models.role import Role  # deve mapear para schema auth.roles (tabela já existente)
 
+# Colunas do RoleRead: a listagem não traz timestamps/relacionamentos nem monta entidades
+_LIST_COLUMNS = (
+    Role.id, Role.nome, Role.descricao, Role.nivel_acesso, Role.permissoes, Role.ativo
+)
+
 
 class RoleRepository:
     """Acesso a dados para o agregado Role (RBAC).
@@ -15,7 +20,7 @@ class RoleRepository:
       - create(data) -> Role
       - get_by_id(role_id) -> Optional[Role]
       - get_by_nome(nome) -> Optional[Role]
-      - list(limit, offset, search, ativo) -> Tuple[list[Role], int]
+      - list(limit, offset, search, ativo) -> Tuple[list[Row], int]
       - update(role_id, data) -> Role
       - delete(role_id, hard=False) -> None
     """
@@ -36,19 +41,16 @@ class RoleRepository:
             data: Dicionário com campos compatíveis com o modelo Role.
 
         Returns:
-            Role persistida (com ID).
+            Role persistida (com ID e defaults do banco, via `INSERT ... RETURNING`).
         """
-        role = Role(**data)  # type: ignore[arg-type]
-        self.session.add(role)
+        role = self.session.scalars(insert(Role).values(**data).returning(Role)).one()
         self.session.commit()
-        self.session.refresh(role)
         return role
 
     # ----------------- READ -------------------
     def get_by_id(self, role_id: int) -> Optional[Role]:
-        """Busca Role por ID."""
-        stmt = select(Role).where(Role.id == role_id)
-        return self.session.execute(stmt).scalars().first()
+        """Busca Role por ID (identity map primeiro; SQL só se não estiver na sessão)."""
+        return self.session.get(Role, role_id)
 
     def get_by_nome(self, nome: str) -> Optional[Role]:
         """Busca Role por nome exato (UNIQUE)."""
@@ -61,8 +63,8 @@ class RoleRepository:
         offset: int = 0,
         search: Optional[str] = None,
         ativo: Optional[bool] = None,
-    ) -> Tuple[list[Role], int]:
-        """Lista roles paginadas com filtros opcionais.
+    ) -> Tuple[list[Row], int]:
+        """Lista roles paginadas (por ID) com filtros opcionais.
 
         Args:
             limit: Tamanho da página.
@@ -71,20 +73,31 @@ class RoleRepository:
             ativo: Filtra por status ativo/inativo.
 
         Returns:
-            (items, total)
+            (items, total) — obtidos numa única query via `COUNT(*) OVER ()`. Os items são
+            `Row`s só com as colunas do RoleRead, sem materializar entidades ORM.
         """
-        stmt = select(Role)
+        stmt = select(*_LIST_COLUMNS)
         if search:
             stmt = stmt.where(Role.nome.ilike(f"%{search}%"))
         if ativo is not None:
             stmt = stmt.where(Role.ativo.is_(ativo))
 
-        total_stmt = select(func.count()).select_from(stmt.subquery())
-        total = self.session.execute(total_stmt).scalar_one()
-
-        stmt = stmt.order_by(Role.id.desc()).limit(limit).offset(offset)
-        items = list(self.session.execute(stmt).scalars().all())
-        return items, int(total)
+        page_stmt = (
+            stmt.add_columns(func.count().over().label("total"))
+            .order_by(Role.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = self.session.execute(page_stmt).all()
+        if rows:
+            return rows, int(rows[0].total)
+
+        # página além do fim: sem linhas não há janela; só então paga o COUNT separado
+        total = 0
+        if offset:
+            total_stmt = select(func.count()).select_from(stmt.subquery())
+            total = self.session.execute(total_stmt).scalar_one()
+        return [], int(total)
 
     # ----------------- UPDATE -----------------
     def update(self, role_id: int, data: dict) -> Role:
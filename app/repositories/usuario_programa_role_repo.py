@@ -1,17 +1,38 @@
 # app/repositories/usuario_programa_role_repo.py
 
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+
+from sqlalchemy import func, lambda_stmt, select, update
 from app.models.usuario_programa_role import UsuarioProgramaRole
 
 class UsuarioProgramaRoleRepository:
     def __init__(self, session: Session):
         self.session = session
 
-    def get_by_usuario_programa(self, usuario_id: int, programa_id: int) -> UsuarioProgramaRole | None:
-        stmt = select(UsuarioProgramaRole).where(
-            UsuarioProgramaRole.usuario_id == usuario_id,
-            UsuarioProgramaRole.programa_id == programa_id,
-            UsuarioProgramaRole.status == "Ativo"
+    def get_by_usuario_programa(
+        self, usuario_id: int, programa_id: int
+    ) -> UsuarioProgramaRole | None:
+        # lambda_stmt: statement em cache; a cada chamada só os dois ids são vinculados
+        stmt = lambda_stmt(
+            lambda: select(UsuarioProgramaRole).where(
+                UsuarioProgramaRole.usuario_id == usuario_id,
+                UsuarioProgramaRole.programa_id == programa_id,
+                UsuarioProgramaRole.status == "Ativo",
+            )
         )
         return self.session.scalar(stmt)
+
+    def desvincular(self, usuario_id: int, programa_id: int) -> bool:
+        """Marca os vínculos ativos como 'Desligado' (UPDATE ... RETURNING, sem SELECT prévio)."""
+        stmt = (
+            update(UsuarioProgramaRole)
+            .where(
+                UsuarioProgramaRole.usuario_id == usuario_id,
+                UsuarioProgramaRole.programa_id == programa_id,
+                UsuarioProgramaRole.status == "Ativo",
+            )
+            # data do próprio banco (CURRENT_DATE), sem date.today() no fuso do processo
+            .values(status="Desligado", data_desvinculacao=func.current_date())
+            .returning(UsuarioProgramaRole.id)
+        )
+        return self.session.execute(stmt).first() is not None
@@ -1,10 +1,15 @@
 from __future__ import annotations
-from typing import Optional
-from sqlalchemy import select, func
+from typing import Iterator, Optional
+from sqlalchemy import Row, select, func, update, delete, insert, lambda_stmt
 from sqlalchemy.orm import Session
 from app.models.usuario import Usuario
 
 
+# Colunas expostas por UsuarioRead: a listagem não traz senha_hash/timestamps
+_LIST_COLUMNS = (Usuario.id, Usuario.email, Usuario.nome_completo, Usuario.role_id, Usuario.ativo)
+_STREAM_BATCH = 100  # linhas por fetch do cursor no streaming (yield_per)
+
+
 class UsuarioRepository:
     """Repositório de acesso a dados para Usuários."""
 
@@ -13,38 +18,58 @@ class UsuarioRepository:
 
     # ----------------- CREATE -----------------
     def create(self, data: dict) -> Usuario:
-        """Cria um usuário no banco de dados."""
-        usuario = Usuario(**data)
-        self.session.add(usuario)
+        """Cria um usuário com `INSERT ... RETURNING` (defaults do banco sem refresh)."""
+        usuario = self.session.scalars(insert(Usuario).values(**data).returning(Usuario)).one()
         self.session.commit()
-        self.session.refresh(usuario)
         return usuario
 
     # ----------------- READ -----------------
     def get_by_id(self, usuario_id: int) -> Optional[Usuario]:
-        """Busca usuário pelo ID."""
-        stmt = select(Usuario).where(Usuario.id == usuario_id)
-        return self.session.execute(stmt).scalars().first()
+        """Busca usuário pelo ID (identity map primeiro; SQL só se não estiver na sessão)."""
+        return self.session.get(Usuario, usuario_id)
 
     def get_by_email(self, email: str) -> Optional[Usuario]:
-        """Busca usuário pelo email."""
-        stmt = select(Usuario).where(Usuario.email == email)
+        """Busca usuário pelo email (login: caminho quente).
+
+        `lambda_stmt`: o SELECT é montado e tem a chave de cache calculada uma vez;
+        nas chamadas seguintes só o parâmetro `email` é vinculado.
+        """
+        stmt = lambda_stmt(lambda: select(Usuario).where(Usuario.email == email))
         return self.session.execute(stmt).scalars().first()
 
     def list(self, limit: int = 10, offset: int = 0, ativo: Optional[bool] = None):
-        """Lista usuários com paginação e filtro opcional por ativo/inativo."""
-        stmt = select(Usuario).offset(offset).limit(limit)
+        """Lista usuários com paginação e filtro opcional por ativo/inativo.
+
+        Uma única query: `COUNT(*) OVER ()` devolve o total junto com cada linha da página.
+        Retorna `Row`s só com as colunas de `_LIST_COLUMNS` (sem materializar entidades ORM).
+        """
+        stmt = select(*_LIST_COLUMNS, func.count().over().label("total"))
         if ativo is not None:
             stmt = stmt.where(Usuario.ativo == ativo)
+        stmt = stmt.order_by(Usuario.id).offset(offset).limit(limit)
 
-        items = self.session.scalars(stmt).all()
+        rows = self.session.execute(stmt).all()
+        if rows:
+            return rows, rows[0].total
 
-        total_stmt = select(func.count()).select_from(Usuario)
-        if ativo is not None:
-            total_stmt = total_stmt.where(Usuario.ativo == ativo)
+        # página além do fim: sem linhas não há janela, então o total sai de um COUNT
+        total = 0
+        if offset:
+            total_stmt = select(func.count()).select_from(Usuario)
+            if ativo is not None:
+                total_stmt = total_stmt.where(Usuario.ativo == ativo)
+            total = self.session.scalar(total_stmt)
+        return [], total
 
-        total = self.session.scalar(total_stmt)
-        return items, total
+    def iter_list(
+        self, limit: int = 10, offset: int = 0, ativo: Optional[bool] = None
+    ) -> Iterator[Row]:
+        """Mesma página de `list`, sem o total, lida do cursor em lotes (`yield_per`)."""
+        stmt = select(*_LIST_COLUMNS)
+        if ativo is not None:
+            stmt = stmt.where(Usuario.ativo == ativo)
+        stmt = stmt.order_by(Usuario.id).offset(offset).limit(limit)
+        yield from self.session.execute(stmt.execution_options(yield_per=_STREAM_BATCH))
 
     def list_all(self):
         """Lista todos os usuários (sem paginação)."""
@@ -53,26 +78,26 @@ class UsuarioRepository:
 
     # ----------------- UPDATE -----------------
     def update(self, usuario_id: int, data: dict) -> Optional[Usuario]:
-        """Atualiza um usuário."""
-        usuario = self.get_by_id(usuario_id)
-        if not usuario:
-            return None
-        for k, v in data.items():
-            if hasattr(usuario, k):
-                setattr(usuario, k, v)
+        """Atualiza um usuário com `UPDATE ... RETURNING` (sem SELECT antes nem refresh depois)."""
+        values = {k: v for k, v in data.items() if k in Usuario.__mapper__.column_attrs}
+        if not values:
+            return self.get_by_id(usuario_id)
+        stmt = (
+            update(Usuario)
+            .where(Usuario.id == usuario_id)
+            .values(**values)
+            .returning(Usuario)
+            .execution_options(populate_existing=True)
+        )
+        usuario = self.session.scalars(stmt).first()
         self.session.commit()
-        self.session.refresh(usuario)
         return usuario
 
     # ----------------- DELETE -----------------
     def delete(self, usuario_id: int, hard: bool = False) -> bool:
-        """Remove usuário do sistema."""
-        usuario = self.get_by_id(usuario_id)
-        if not usuario:
-            return False
-        if hard:
-            self.session.delete(usuario)
-        else:
-            usuario.ativo = False
+        """Remove usuário do sistema (hard) ou desativa (soft) num único round-trip."""
+        stmt = delete(Usuario) if hard else update(Usuario).values(ativo=False)
+        stmt = stmt.where(Usuario.id == usuario_id).returning(Usuario.id)
+        found = self.session.execute(stmt).first() is not None
         self.session.commit()
-        return True
+        return found
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from typing import Optional, List, Literal
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+from app.schemas.http import CursorPage
 
 
 # --------------------------------------------------------
@@ -86,6 +88,15 @@ class DocenteCreate(DocenteBase):
     data_vinculacao: date
 
 
+# Importação em lote: um único INSERT multi-linha (limite protege o request/transação)
+DOCENTE_BULK_MAX = 1000
+
+
+class DocenteBulkCreate(RootModel[List[DocenteCreate]]):
+    """Lista de DocenteCreate para `POST /docentes/bulk`."""
+    root: List[DocenteCreate] = Field(min_length=1, max_length=DOCENTE_BULK_MAX)
+
+
 # --------------------------------------------------------
 # UPDATE (PUT) — você decide a semântica:
 #   - FULL (mais REST-estrito): exigir campos mínimos e substituir.
@@ -128,13 +139,9 @@ class DocenteRead(DocenteBase):
     updated_at: datetime
 
 # --------------------------------------------------------
-# LIST — paginação amigável ao front
+# LIST — paginação por cursor (keyset) amigável ao front
 # --------------------------------------------------------
-class DocenteList(BaseModel):
-    """Retorno paginado de docentes para listagens no frontend."""
-    items: List[DocenteRead]
-    total: int
-    limit: int
-    offset: int
+class DocenteList(CursorPage[DocenteRead]):
+    """Retorno paginado (cursor) de docentes para listagens no frontend."""
 
     model_config = ConfigDict(from_attributes=True)
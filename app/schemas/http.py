@@ -22,3 +22,13 @@ class Page(BaseModel, Generic[T]):
     """Listas paginadas previsíveis no front."""
     data: List[T]
     meta: PageMeta
+
+class CursorPage(BaseModel, Generic[T]):
+    """Página por cursor (keyset): sem OFFSET e sem COUNT(*).
+
+    - `next_cursor`: enviar como `?cursor=` para obter a próxima página.
+    - `has_more`: False na última página.
+    """
+    items: List[T]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
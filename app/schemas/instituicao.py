@@ -1,6 +1,47 @@
 from __future__ import annotations
-from typing import Optional
-from pydantic import BaseModel, Field, HttpUrl
+import re
+from typing import Annotated, Literal, Optional
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    StringConstraints,
+)
+
+from app.schemas.http import CursorPage
+
+
+# =====================================================
+# Tipos restritos: checagens no pydantic-core (Rust), sem validators Python
+# =====================================================
+_NAO_DIGITO = re.compile(r"\D")
+
+
+def _sem_mascara(valor: object) -> object:
+    """Remove a máscara do CNPJ (única etapa em Python); o formato é checado pelo pattern."""
+    return _NAO_DIGITO.sub("", valor) if isinstance(valor, str) else valor
+
+
+# CNPJ: guardado só com os 14 dígitos; pontuação apenas na saída
+CNPJ = Annotated[str, BeforeValidator(_sem_mascara), StringConstraints(pattern=r"^\d{14}$")]
+
+# Código da instituição: sem espaços nas pontas, guardado em maiúsculas
+CodigoInstituicao = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        to_upper=True,
+        min_length=2,
+        max_length=20,
+        pattern=r"^[A-Za-z0-9_-]+$",
+    ),
+]
+
+# Categoria controlada (como os Literals de docente): checada no validador Rust, sem
+# validator Python por request
+TipoInstituicao = Literal["Federal", "Estadual", "Municipal", "Privada"]
 
 
 # =====================================================
@@ -9,12 +50,12 @@ from pydantic import BaseModel, Field, HttpUrl
 class InstituicaoBase(BaseModel):
     """Campos compartilhados pelas operações de Instituição."""
 
-    codigo: str = Field(..., json_schema_extra={"example": "UEPB"})
+    codigo: CodigoInstituicao = Field(..., json_schema_extra={"example": "UEPB"})
     nome_completo: str
     nome_abreviado: str
     sigla: str
-    tipo: str                                # Federal, Estadual, Municipal, Privada
-    cnpj: Optional[str] = None
+    tipo: TipoInstituicao
+    cnpj: Optional[CNPJ] = None
     natureza_juridica: Optional[str] = None
     endereco: Optional[dict] = Field(default_factory=dict)
     contatos: Optional[dict] = Field(default_factory=dict)
@@ -41,12 +82,12 @@ class InstituicaoCreate(InstituicaoBase):
 # =====================================================
 class InstituicaoUpdate(BaseModel):
     """PATCH = parcial; todos opcionais."""
-    codigo: Optional[str] = None
+    codigo: Optional[CodigoInstituicao] = None
     nome_completo: Optional[str] = None
     nome_abreviado: Optional[str] = None
     sigla: Optional[str] = None
-    tipo: Optional[str] = None
-    cnpj: Optional[str] = None
+    tipo: Optional[TipoInstituicao] = None
+    cnpj: Optional[CNPJ] = None
     natureza_juridica: Optional[str] = None
     endereco: Optional[dict] = None
     contatos: Optional[dict] = None
@@ -68,24 +109,31 @@ class InstituicaoPut(InstituicaoBase):
     nome_completo: str
     nome_abreviado: str
     sigla: str
-    tipo: str
+    tipo: TipoInstituicao
 
 
 # =====================================================
 # Read (Response)
 # =====================================================
 class InstituicaoRead(InstituicaoBase):
-    """Modelo de saída (response) com ID incluso."""
+    """Modelo de saída (response) com ID incluso.
+
+    Mesmos tipos da entrada (Literal, CNPJ, HttpUrl): o OpenAPI descreve o que a API
+    aceita e devolve. As listagens montam o schema via model_construct; só as URLs são
+    convertidas (`INSTITUICAO_READ_COERCE`).
+    """
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Campos do InstituicaoRead que o fast path (orm_list) converte: no banco são str
+INSTITUICAO_READ_COERCE = {"logo_url": HttpUrl, "website": HttpUrl}
 
 
 # =====================================================
 # Paginated
 # =====================================================
-class InstituicaoList(BaseModel):
-    """Lista paginada de instituições."""
-    items: list[InstituicaoRead]
-    total: int
+class InstituicaoList(CursorPage[InstituicaoRead]):
+    """Lista paginada (cursor) de instituições."""
+    pass
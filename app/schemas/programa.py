@@ -1,7 +1,9 @@
 from __future__ import annotations
-from typing import Optional, List
+from typing import Optional
 from pydantic import BaseModel, ConfigDict
 
+from app.schemas.http import CursorPage
+
 
 # ----------------- BASE -----------------
 class ProgramaBase(BaseModel):
@@ -59,10 +61,9 @@ class ProgramaRead(ProgramaBase):
 
 
 # ----------------- LIST (PAGINADO) -----------------
-class ProgramaList(BaseModel):
+class ProgramaList(CursorPage[ProgramaRead]):
     """
-    Esquema para listagem paginada de Programas.
-    Retorna a lista de Programas e o total de registros.
+    Esquema para listagem paginada (cursor) de Programas.
+    Retorna a página de Programas e o cursor da próxima página.
     """
-    items: List[ProgramaRead]
-    total: int
+    pass
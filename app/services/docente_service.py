@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 from fastapi import HTTPException, status
-from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 
+from app.core.serialization import to_model_kwargs
+from app.core.entity_cache import cached_read, invalidate_on_write
+from app.core.pagination import decode_cursor, split_page
 from app.repositories.docente_repo import DocenteRepository
 from app.models.docente import Docente
 from app.schemas.docente import (
+    DocenteBulkCreate,
     DocenteCreate,
     DocenteUpdate,
     DocentePatch,
@@ -22,29 +25,33 @@ class DocenteService:
         self.repo = DocenteRepository(db)
 
     # ----------------- CREATE -----------------
-    def create_docente(self, payload: DocenteCreate) -> DocenteRead:
-        # ... (seu código existente) ...
-        docente = self.repo.create(payload)
-        return DocenteRead.model_validate(docente)
+    def create_docente(self, payload: DocenteCreate) -> Docente:
+        docente = self.repo.create(to_model_kwargs(payload))
+        self.db.commit()  # RETURNING já trouxe created_at/updated_at: sem refresh
+        return docente
+
+    def bulk_create_docentes(self, payload: DocenteBulkCreate) -> list[Docente]:
+        """Cria vários docentes numa transação (tudo ou nada; duplicidade -> 409 global)."""
+        docentes = self.repo.create_many([to_model_kwargs(p) for p in payload.root])
+        self.db.commit()
+        return docentes
 
     # ----------------- GET -----------------
+    @cached_read("docente", DocenteRead)
     def get_docente(self, docente_id: int) -> DocenteRead:
-        docente = self.repo.get(docente_id)
-        if not docente:
-            raise HTTPException(status_code=404, detail="Docente não encontrado.")
-        return DocenteRead.model_validate(docente)
+        return self.db.get_one(Docente, docente_id)  # NoResultFound -> 404 (handler global)
 
     # ----------------- LIST -----------------
-    def list_docentes(self, skip: int, limit: int) -> tuple[list[Docente], int]:
-        # ... (se já tiver, mantenha) ...
-        stmt_total = select(func.count()).select_from(Docente)
-        total = self.db.scalar(stmt_total) or 0
-        stmt_items = select(Docente).order_by(Docente.id.asc()).offset(skip).limit(limit)
-        items = list(self.db.scalars(stmt_items))
-        return items, int(total)
+    def list_docentes(
+        self, limit: int, cursor: str | None = None
+    ) -> tuple[list[Docente], str | None, bool]:
+        """Keyset (sem OFFSET/COUNT): retorna (items, next_cursor, has_more)."""
+        rows = self.repo.list(limit=limit, after_id=decode_cursor(cursor))
+        return split_page(rows, limit)
 
     # ----------------- PUT (atualização “merge”) -----------------
-    def update_docente(self, docente_id: int, payload: DocenteUpdate) -> DocenteRead:
+    @invalidate_on_write("docente")
+    def update_docente(self, docente_id: int, payload: DocenteUpdate) -> Docente:
         """
         PUT com semântica prática: aplica somente os campos enviados (merge).
         Se quiser semântica FULL, torne campos obrigatórios em DocenteUpdate.
@@ -52,14 +59,15 @@ class DocenteService:
         docente = self.repo.get(docente_id)
         if not docente:
             raise HTTPException(status_code=404, detail="Docente não encontrado.")
-        fields = payload.model_dump(exclude_unset=True)  # 👈 tri-estado controlado no PATCH
+        fields = to_model_kwargs(payload, only_set=True)  # 👈 tri-estado controlado no PATCH
         if not fields:
-            return DocenteRead.model_validate(docente)
+            return docente
         docente = self.repo.update_fields(docente, fields)
-        return DocenteRead.model_validate(docente)
+        return docente
 
     # ----------------- PATCH (merge-patch RFC 7396) -----------------
-    def patch_docente(self, docente_id: int, payload: DocentePatch) -> DocenteRead:
+    @invalidate_on_write("docente")
+    def patch_docente(self, docente_id: int, payload: DocentePatch) -> Docente:
         """
         PATCH merge-patch:
         - campo ausente: não altera
@@ -69,15 +77,16 @@ class DocenteService:
         docente = self.repo.get(docente_id)
         if not docente:
             raise HTTPException(status_code=404, detail="Docente não encontrado.")
-        fields = payload.model_dump(exclude_unset=True)  # ⛔ NÃO use exclude_none aqui
+        fields = to_model_kwargs(payload, only_set=True)  # ⛔ NÃO use exclude_none aqui
         if not fields:
-            return DocenteRead.model_validate(docente)
+            return docente
         docente = self.repo.update_fields(docente, fields)
-        return DocenteRead.model_validate(docente)
+        return docente
 
     # ----------------- DELETE -----------------
-    def delete_docente(self, docente_id: int) -> None:
-        docente = self.repo.get(docente_id)
-        if not docente:
-            raise HTTPException(status_code=404, detail="Docente não encontrado.")
-        self.repo.delete(docente)
+    @invalidate_on_write("docente")
+    def delete_docente(self, docente_id: int) -> bool:
+        """Remove o docente; False se não existir (a rota devolve 404)."""
+        ok = self.repo.delete(docente_id)
+        self.db.commit()
+        return ok
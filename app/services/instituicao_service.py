@@ -1,12 +1,14 @@
 # app/services/instituicao_service.py
 from __future__ import annotations
-from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from app.deps import get_db
 
 
-from app.schemas.instituicao import InstituicaoUpdate, InstituicaoRead, InstituicaoPut
+from app.core.serialization import to_model_kwargs
+from app.core.entity_cache import cached_read, invalidate_on_write
+from app.core.pagination import decode_cursor, split_page
+from app.models.instituicao import Instituicao
+from app.schemas.instituicao import InstituicaoUpdate, InstituicaoPut, InstituicaoRead
 from app.repositories.instituicao_repo import InstituicaoRepository
 
 
@@ -18,47 +20,48 @@ class InstituicaoService:
     def create(self, data: dict):
         return self.repo.create(data)
 
-    def list(self, limit: int, offset: int):
-        return self.repo.list(limit, offset)
+    def list(self, limit: int, cursor: str | None = None):
+        """Página por cursor: retorna (items, next_cursor, has_more)."""
+        rows = self.repo.list(limit, after_id=decode_cursor(cursor))
+        return split_page(rows, limit)
 
-    def get(self, instituicao_id: int):
-        return self.repo.get(instituicao_id)
+    @cached_read("instituicao", InstituicaoRead)
+    def get(self, instituicao_id: int) -> InstituicaoRead:
+        # get_one: NoResultFound -> 404 no handler global
+        return self.repo.db.get_one(Instituicao, instituicao_id)
 
+    @invalidate_on_write("instituicao")
     def update(self, instituicao_id: int, data: dict):
         return self.repo.update(instituicao_id, data)
 
+    @invalidate_on_write("instituicao")
     def delete(self, instituicao_id: int):
         return self.repo.delete(instituicao_id)
 
+    @invalidate_on_write("instituicao")
     def put(self, instituicao_id: int, payload: InstituicaoPut) -> InstituicaoRead:
         obj = self.repo.get(instituicao_id)
         if not obj:
             raise HTTPException(status_code=404, detail="Instituição não encontrada")
 
-        data = payload.model_dump()  # PUT = payload completo
+        data = to_model_kwargs(payload)  # PUT = payload completo
         # regra opcional: impedir mudança de 'codigo'
         data.pop("codigo", None)
 
         self.repo.update_fields(obj, data)  # aplica campos
-        try:
-            self.repo.db.commit()  # PERSISTE
-        except IntegrityError as e:
-            self.repo.db.rollback()
-            raise  # handler global devolve 409
+        self.repo.db.commit()  # PERSISTE (IntegrityError -> handler global: rollback + 409)
         self.repo.db.refresh(obj)  # RECARREGA (defaults/onupdate)
 
-        return InstituicaoRead.model_validate(obj)
+        # Mesmo tipo que `get` (schema, não ORM): o chamador não depende de hit/miss
+        return InstituicaoRead.model_validate(obj, from_attributes=True)
 
+    @invalidate_on_write("instituicao")
     def patch(self, instituicao_id: int, payload: InstituicaoUpdate) -> InstituicaoRead:
         obj = self.repo.get(instituicao_id)
         if not obj:
             raise HTTPException(status_code=404, detail="Instituição não encontrada")
-        changes = payload.model_dump(exclude_unset=True)
-        try:
-            self.repo.update_partial(obj, changes)
-            self.repo.db.commit()
-        except IntegrityError as e:
-            self.repo.db.rollback()
-            raise HTTPException(status_code=409, detail="Violação de integridade (sigla/código únicos).") from e
+        changes = to_model_kwargs(payload, only_set=True)
+        self.repo.update_partial(obj, changes)
+        self.repo.db.commit()  # IntegrityError -> handler global: rollback + 409
         self.repo.db.refresh(obj)
-        return InstituicaoRead.model_validate(obj)
\ No newline at end of file
+        return InstituicaoRead.model_validate(obj, from_attributes=True)
\ No newline at end of file
@@ -1,9 +1,12 @@
 from __future__ import annotations
 from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 
+from app.core.entity_cache import cached_read, invalidate_on_write
+from app.core.pagination import decode_cursor, split_page
+from app.core.serialization import orm_list, schema_fields, to_model_kwargs
 from app.repositories.programa_repo import ProgramaRepository
 from app.schemas.programa import (
     ProgramaCreate,
@@ -13,6 +16,10 @@ from app.schemas.programa import (
 )
 from app.models.programa import Programa
 
+# Validador compilado uma vez para listas (ORM -> ProgramaRead numa única chamada)
+_PROGRAMA_LIST_ADAPTER = TypeAdapter(List[ProgramaRead])
+_PROGRAMA_FIELDS = schema_fields(ProgramaRead)
+
 
 class ProgramaService:
     """Camada de regras de negócio para Programas."""
@@ -21,50 +28,54 @@ class ProgramaService:
         self.repo = ProgramaRepository(db)
 
     # ----------------- CREATE -----------------
-    def create_programa(self, payload: ProgramaCreate) -> ProgramaRead:
+    def create_programa(self, payload: ProgramaCreate) -> Programa:
         """
         Cria um novo programa no sistema.
         """
-        try:
-            programa = self.repo.create(payload.model_dump())
-        except IntegrityError as e:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Violação de unicidade em Programa",
-            ) from e
-        return ProgramaRead.model_validate(programa)
+        # IntegrityError (unicidade) -> rollback + 409 no handler global (app/core/errors.py)
+        return self.repo.create(to_model_kwargs(payload))
 
     # ----------------- READ -----------------
-    def get_programa(self, programa_id: int) -> Optional[ProgramaRead]:
-        """Obtém um programa pelo ID."""
-        programa = self.repo.get(programa_id)
-        return ProgramaRead.model_validate(programa) if programa else None
+    @cached_read("programa", ProgramaRead)
+    def get_programa(self, programa_id: int) -> ProgramaRead:
+        """Obtém um programa pelo ID (NoResultFound -> 404 no handler global)."""
+        return self.repo.session.get_one(Programa, programa_id)
 
     def list_programas(
-        self, limit: int = 50, offset: int = 0
-    ) -> Tuple[List[ProgramaRead], int]:
-        """Lista programas com paginação."""
-        items, total = self.repo.list(limit=limit, offset=offset)
-        return [ProgramaRead.model_validate(i) for i in items], total
+        self, limit: int = 50, cursor: Optional[str] = None
+    ) -> Tuple[List[ProgramaRead], Optional[str], bool]:
+        """Lista programas com paginação por cursor: (items, next_cursor, has_more)."""
+        rows = self.repo.list(limit=limit, after_id=decode_cursor(cursor))
+        items, next_cursor, has_more = split_page(rows, limit)
+        programas = orm_list(
+            ProgramaRead, items, fields=_PROGRAMA_FIELDS, adapter=_PROGRAMA_LIST_ADAPTER
+        )
+        return programas, next_cursor, has_more
 
     def list_all_programas(self) -> List[ProgramaRead]:
         """Lista todos os programas (sem paginação)."""
-        items = self.repo.list_all()
-        return [ProgramaRead.model_validate(i) for i in items]
+        return orm_list(
+            ProgramaRead,
+            self.repo.list_all(),
+            fields=_PROGRAMA_FIELDS,
+            adapter=_PROGRAMA_LIST_ADAPTER,
+        )
 
     # ----------------- UPDATE -----------------
-    def update_programa(self, programa_id: int, payload: ProgramaUpdate) -> Optional[ProgramaRead]:
+    @invalidate_on_write("programa")
+    def update_programa(self, programa_id: int, payload: ProgramaUpdate) -> Programa:
         """Atualiza um programa existente."""
-        data = payload.model_dump(exclude_unset=True)
+        data = to_model_kwargs(payload, only_set=True)
         programa = self.repo.update(programa_id, data)
         if not programa:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Programa não encontrado",
             )
-        return ProgramaRead.model_validate(programa)
+        return programa
 
     # ----------------- DELETE -----------------
+    @invalidate_on_write("programa")
     def delete_programa(self, programa_id: int, hard: bool = False) -> bool:
         """Remove um programa do sistema."""
         ok = self.repo.delete(programa_id, hard=hard)
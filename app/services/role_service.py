@@ -1,43 +1,78 @@
 # app/services/role_service.py
+from sqlalchemy import Row, delete, insert, update
 from sqlalchemy.orm import Session
 from typing import List, Optional, Tuple
+from pydantic import TypeAdapter
+from app.core.serialization import orm_list, schema_fields, to_model_kwargs
+from app.core.entity_cache import (
+    cached_payload,
+    cached_read,
+    invalidate_on_write,
+    invalidate_payload,
+)
 from app.models.role import Role
-from app.schemas.role import RoleCreate, RoleUpdate
+from app.repositories.role_repo import RoleRepository
+from app.schemas.role import RoleCreate, RoleUpdate, RoleRead
+
+_ROLE_FIELDS = schema_fields(RoleRead)
+_ROLE_LIST_ADAPTER = TypeAdapter(List[RoleRead])
+
 
 class RoleService:
     def __init__(self, db: Session):
         self.db = db
+        self.repo = RoleRepository(db)
 
     def create(self, payload: RoleCreate) -> Role:
-        obj = Role(**payload.model_dump())
-        self.db.add(obj)
+        # INSERT ... RETURNING: permissoes/created_at do banco voltam sem refresh
+        stmt = insert(Role).values(**to_model_kwargs(payload)).returning(Role)
+        obj = self.db.scalars(stmt).one()
         self.db.commit()
-        self.db.refresh(obj)
+        invalidate_payload("role")
         return obj
 
-    def list(self, limit: int = 50, offset: int = 0) -> Tuple[List[Role], int]:
-        q = self.db.query(Role).offset(offset).limit(limit)
-        items = q.all()
-        total = self.db.query(Role).count()
-        return items, total
+    def list_json(self) -> bytes:
+        """Listagem (página padrão) já em JSON, servida do cache por worker.
+
+        Roles são lookup quase estático: no hit não há query nem serialização. Qualquer
+        escrita (create/update/delete) descarta os bytes; o TTL cobre os outros workers.
+        """
+        def build() -> bytes:
+            rows, _ = self.list()
+            roles = orm_list(RoleRead, rows, fields=_ROLE_FIELDS, adapter=_ROLE_LIST_ADAPTER)
+            return _ROLE_LIST_ADAPTER.dump_json(roles)
+
+        return cached_payload("role", build)
+
+    def list(self, limit: int = 50, offset: int = 0) -> Tuple[List[Row], int]:
+        """Página de roles (colunas do RoleRead) e total, numa única query."""
+        return self.repo.list(limit=limit, offset=offset)
 
-    def get(self, role_id: int) -> Optional[Role]:
-        return self.db.get(Role, role_id)
+    @cached_read("role", RoleRead)
+    def get(self, role_id: int) -> RoleRead:
+        return self.db.get_one(Role, role_id)  # NoResultFound -> 404 (handler global)
 
+    @invalidate_on_write("role")
     def update(self, role_id: int, payload: RoleUpdate) -> Optional[Role]:
-        obj = self.get(role_id)
-        if not obj:
-            return None
-        for field, value in payload.model_dump(exclude_unset=True).items():
-            setattr(obj, field, value)
+        values = to_model_kwargs(payload, only_set=True)
+        if not values:
+            return self.db.get(Role, role_id)  # ORM (não o schema cacheado de `get`)
+        # UPDATE ... RETURNING: um round-trip, sem SELECT prévio nem refresh após o commit
+        stmt = (
+            update(Role)
+            .where(Role.id == role_id)
+            .values(**values)
+            .returning(Role)
+            .execution_options(populate_existing=True)
+        )
+        obj = self.db.scalars(stmt).first()
         self.db.commit()
-        self.db.refresh(obj)
         return obj
 
+    @invalidate_on_write("role")
     def delete(self, role_id: int) -> bool:
-        obj = self.get(role_id)
-        if not obj:
-            return False
-        self.db.delete(obj)
+        # DELETE ... RETURNING: sem SELECT prévio; vínculos saem via ON DELETE CASCADE
+        stmt = delete(Role).where(Role.id == role_id).returning(Role.id)
+        deleted = self.db.execute(stmt).first() is not None
         self.db.commit()
-        return True
+        return deleted
@@ -1,13 +1,20 @@
 from __future__ import annotations
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
 from sqlalchemy.orm import Session
 from passlib.context import CryptContext
 
+from pydantic import TypeAdapter
+
+from app.core.serialization import from_orm_fast, orm_list, schema_fields, to_model_kwargs
 from app.repositories.usuario_repo import UsuarioRepository
 from app.schemas.usuario import UsuarioCreate, UsuarioUpdate, UsuarioRead, UsuarioList
 from app.models.usuario import Usuario
 
 
+# ORM -> UsuarioRead sem revalidar (ver app/core/serialization.py)
+_USUARIO_FIELDS = schema_fields(UsuarioRead)
+_USUARIO_LIST_ADAPTER = TypeAdapter(List[UsuarioRead])
+
 # ----------------- CRIPTOGRAFIA DE SENHA -----------------
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -39,23 +46,23 @@ class UsuarioService:
         - Gera o hash da senha e salva no banco.
         - Retorna um `UsuarioRead` (sem senha).
         """
-        data = payload.model_dump()
+        data = to_model_kwargs(payload)
         senha_pura = data.pop("senha")
         data["senha_hash"] = self._hash_password(senha_pura)
 
         usuario = self.repo.create(data)
-        return UsuarioRead.model_validate(usuario)
+        return from_orm_fast(UsuarioRead, usuario, _USUARIO_FIELDS)
 
     # ----------------- READ -----------------
     def get_usuario(self, usuario_id: int) -> Optional[UsuarioRead]:
         """Busca um usuário por ID."""
         usuario = self.repo.get_by_id(usuario_id)
-        return UsuarioRead.model_validate(usuario) if usuario else None
+        return from_orm_fast(UsuarioRead, usuario, _USUARIO_FIELDS) if usuario else None
 
     def get_usuario_by_email(self, email: str) -> Optional[UsuarioRead]:
         """Busca usuário pelo e-mail (único)."""
         usuario = self.repo.get_by_email(email)
-        return UsuarioRead.model_validate(usuario) if usuario else None
+        return from_orm_fast(UsuarioRead, usuario, _USUARIO_FIELDS) if usuario else None
 
     def list_usuarios(
         self, limit: int = 50, offset: int = 0, ativo: Optional[bool] = None
@@ -63,13 +70,22 @@ class UsuarioService:
         """
         Lista usuários com paginação.
         """
-        items, total = self.repo.list(limit=limit, offset=offset, ativo=ativo)
-        return [UsuarioRead.model_validate(i) for i in items], total
+        # `Row`s só com as colunas do UsuarioRead (sem senha_hash): ver UsuarioRepository.list
+        rows, total = self.repo.list(limit=limit, offset=offset, ativo=ativo)
+        items = orm_list(UsuarioRead, rows, fields=_USUARIO_FIELDS, adapter=_USUARIO_LIST_ADAPTER)
+        return items, total
+
+    def iter_usuarios(
+        self, limit: int = 50, offset: int = 0, ativo: Optional[bool] = None
+    ) -> Iterator[UsuarioRead]:
+        """Página de usuários um a um, conforme saem do cursor (para streaming NDJSON)."""
+        for row in self.repo.iter_list(limit=limit, offset=offset, ativo=ativo):
+            yield from_orm_fast(UsuarioRead, row, _USUARIO_FIELDS)
 
     def list_all_usuarios(self) -> List[UsuarioRead]:
         """Lista todos os usuários (sem paginação)."""
         items = self.repo.list_all()
-        return [UsuarioRead.model_validate(i) for i in items]
+        return orm_list(UsuarioRead, items, fields=_USUARIO_FIELDS, adapter=_USUARIO_LIST_ADAPTER)
 
     # ----------------- UPDATE -----------------
     def update_usuario(self, usuario_id: int, payload: UsuarioUpdate) -> Optional[UsuarioRead]:
@@ -77,12 +93,12 @@ class UsuarioService:
         Atualiza um usuário existente.
         - Se `senha` for enviada, gera novo hash antes de salvar.
         """
-        data = payload.model_dump(exclude_unset=True)
+        data = to_model_kwargs(payload, only_set=True)
         if "senha" in data:
             data["senha_hash"] = self._hash_password(data.pop("senha"))
 
         usuario = self.repo.update(usuario_id, data)
-        return UsuarioRead.model_validate(usuario) if usuario else None
+        return from_orm_fast(UsuarioRead, usuario, _USUARIO_FIELDS) if usuario else None
 
     # ----------------- DELETE -----------------
     def delete_usuario(self, usuario_id: int, hard: bool = False) -> bool:
@@ -106,4 +122,4 @@ class UsuarioService:
             return None
         if not self._verify_password(senha, usuario.senha_hash):
             return None
-        return UsuarioRead.model_validate(usuario)
+        return from_orm_fast(UsuarioRead, usuario, _USUARIO_FIELDS)
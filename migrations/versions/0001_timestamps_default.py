@@ -0,0 +1,45 @@
+"""created_at/updated_at preenchidos pelo Postgres (Instituicao e Docente)
+
+Os modelos deixaram de mandar os timestamps no INSERT (server_default). Tabelas criadas
+pelo create_all antigo têm essas colunas NOT NULL *sem* DEFAULT: sem esta revisão, todo
+INSERT nelas falha com not-null violation.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    # Instituições: TIMESTAMP sem fuso, em UTC (como o antigo datetime.utcnow)
+    op.execute(
+        """
+        ALTER TABLE core.instituicoes
+            ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+            ALTER COLUMN updated_at SET DEFAULT timezone('utc', now())
+        """
+    )
+    # Docentes: TIMESTAMP sem fuso com now(), como em mvp-schema-db-ppghub.sql
+    op.execute(
+        """
+        ALTER TABLE academic.docentes
+            ALTER COLUMN created_at SET DEFAULT now(),
+            ALTER COLUMN updated_at SET DEFAULT now()
+        """
+    )
+
+
+def downgrade() -> None:
+    for tabela in ("core.instituicoes", "academic.docentes"):
+        op.execute(
+            f"ALTER TABLE {tabela} "
+            "ALTER COLUMN created_at DROP DEFAULT, ALTER COLUMN updated_at DROP DEFAULT"
+        )
@@ -0,0 +1,60 @@
+"""CNPJ guardado só com os 14 dígitos (Instituicao.cnpj String(14))
+
+Linhas antigas podem ter a máscara ("12.345.678/0001-90"); as novas chegam só com dígitos
+("12345678000190"). Sem este backfill as duas formas convivem e a unicidade do CNPJ não
+pega a duplicata. Aborta (a transação da revisão desfaz tudo) se a normalização gerar
+duplicatas ou valores com mais de 14 dígitos: corrija essas linhas antes.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        r"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1
+                FROM core.instituicoes
+                WHERE NULLIF(regexp_replace(cnpj, '\D', '', 'g'), '') IS NOT NULL
+                GROUP BY regexp_replace(cnpj, '\D', '', 'g')
+                HAVING count(*) > 1
+            ) THEN
+                RAISE EXCEPTION 'core.instituicoes: CNPJs duplicados após remover a máscara';
+            END IF;
+            IF EXISTS (
+                SELECT 1
+                FROM core.instituicoes
+                WHERE length(regexp_replace(cnpj, '\D', '', 'g')) > 14
+            ) THEN
+                RAISE EXCEPTION 'core.instituicoes: CNPJ com mais de 14 dígitos';
+            END IF;
+        END
+        $$
+        """
+    )
+    # Só as linhas com máscara (ou vazias) são reescritas
+    op.execute(
+        r"""
+        UPDATE core.instituicoes
+        SET cnpj = NULLIF(regexp_replace(cnpj, '\D', '', 'g'), '')
+        WHERE cnpj ~ '\D' OR cnpj = ''
+        """
+    )
+    op.execute("ALTER TABLE core.instituicoes ALTER COLUMN cnpj TYPE varchar(14)")
+
+
+def downgrade() -> None:
+    # A máscara removida não volta; só o tamanho anterior da coluna
+    op.execute("ALTER TABLE core.instituicoes ALTER COLUMN cnpj TYPE varchar(20)")
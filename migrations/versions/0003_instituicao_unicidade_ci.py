@@ -0,0 +1,92 @@
+"""Unicidade case-insensitive de codigo/sigla em core.instituicoes
+
+O modelo troca os UNIQUE simples (e os index=True redundantes) por índices únicos em
+lower(codigo) / lower(sigla). O create_all não cria esses índices em tabelas existentes
+nem remove as constraints antigas: sem esta revisão, "UEPB" e "uepb" continuam aceitos.
+
+Os índices são criados/removidos com CONCURRENTLY (sem bloquear escritas), fora de
+transação. Se um CREATE ... CONCURRENTLY falhar no meio, ele deixa o índice INVALID e o
+IF NOT EXISTS de uma nova execução o pularia: faça DROP INDEX core.<nome> antes de rodar
+de novo.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+# Índices redundantes do index=True antigo (nome com e sem o prefixo do schema)
+_INDICES_ANTIGOS = (
+    "ix_core_instituicoes_codigo",
+    "ix_core_instituicoes_sigla",
+    "ix_core_instituicoes_id",
+    "ix_instituicoes_codigo",
+    "ix_instituicoes_sigla",
+    "ix_instituicoes_id",
+)
+
+
+def upgrade() -> None:
+    # 1) Aborta antes de criar qualquer índice se já houver colisões só de caixa
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM core.instituicoes GROUP BY lower(codigo) HAVING count(*) > 1
+            ) THEN
+                RAISE EXCEPTION
+                    'core.instituicoes: codigo duplicado ignorando maiúsculas/minúsculas';
+            END IF;
+            IF EXISTS (
+                SELECT 1 FROM core.instituicoes GROUP BY lower(sigla) HAVING count(*) > 1
+            ) THEN
+                RAISE EXCEPTION
+                    'core.instituicoes: sigla duplicada ignorando maiúsculas/minúsculas';
+            END IF;
+        END
+        $$
+        """
+    )
+    with op.get_context().autocommit_block():
+        # 2) Índices novos, sem bloquear escritas
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_instituicao_codigo_ci "
+            "ON core.instituicoes (lower(codigo))"
+        )
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_instituicao_sigla_ci "
+            "ON core.instituicoes (lower(sigla))"
+        )
+        # 3) Constraints antigas: nomes do modelo anterior e do mvp-schema-db-ppghub.sql
+        op.execute(
+            """
+            ALTER TABLE core.instituicoes
+                DROP CONSTRAINT IF EXISTS uq_instituicao_codigo,
+                DROP CONSTRAINT IF EXISTS uq_instituicao_sigla,
+                DROP CONSTRAINT IF EXISTS instituicoes_codigo_key
+            """
+        )
+        # 4) Índices redundantes
+        for nome in _INDICES_ANTIGOS:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS core.{nome}")
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE core.instituicoes
+            ADD CONSTRAINT uq_instituicao_codigo UNIQUE (codigo),
+            ADD CONSTRAINT uq_instituicao_sigla UNIQUE (sigla)
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS core.uq_instituicao_codigo_ci")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS core.uq_instituicao_sigla_ci")
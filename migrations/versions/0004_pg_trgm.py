@@ -0,0 +1,41 @@
+"""Extensão pg_trgm e índices de busca por trigramas
+
+Pré-requisito de provisionamento: CREATE EXTENSION exige privilégio de CREATE no banco
+(em Postgres gerenciado, rode esta revisão com o papel administrador, não com o da
+aplicação). Sem a extensão, o startup só avisa e o create_all pula os índices de
+trigramas; esta revisão também os cria em tabelas que já existiam.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():  # CREATE INDEX CONCURRENTLY: fora de transação
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_docentes_areas_interesse_trgm "
+            "ON academic.docentes USING gin (areas_interesse gin_trgm_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_linhas_pesquisa_palavras_chave_trgm "
+            "ON core.linhas_pesquisa USING gin (palavras_chave gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    # A extensão fica: pode ser usada por outros objetos do banco
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS academic.ix_docentes_areas_interesse_trgm")
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS core.ix_linhas_pesquisa_palavras_chave_trgm"
+        )
@@ -0,0 +1,77 @@
+"""created_at/updated_at como timestamptz com DEFAULT now() em todos os modelos
+
+Programa, Role e Usuario já usavam `DateTime(timezone=True)` + now(); Instituicao
+(TIMESTAMP em UTC via timezone('utc', now())), Docente (TIMESTAMP com now() no fuso da
+sessão) e o vínculo usuário-programa (TIMESTAMP com utcnow do Python) passam ao mesmo
+padrão. O USING converte cada coluna conforme o fuso em que foi gravada.
+
+ALTER COLUMN TYPE reescreve a tabela sob ACCESS EXCLUSIVE: aplique em janela de
+manutenção em tabelas grandes.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    # Gravados em UTC (timezone('utc', now()))
+    op.execute(
+        """
+        ALTER TABLE core.instituicoes
+            ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+            ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'UTC',
+            ALTER COLUMN created_at SET DEFAULT now(),
+            ALTER COLUMN updated_at SET DEFAULT now()
+        """
+    )
+    # Gravados com now() sem fuso: sem USING, o Postgres os lê no fuso da sessão
+    op.execute(
+        """
+        ALTER TABLE academic.docentes
+            ALTER COLUMN created_at TYPE timestamptz,
+            ALTER COLUMN updated_at TYPE timestamptz
+        """
+    )
+    # Gravado pela aplicação com datetime.utcnow
+    op.execute(
+        """
+        ALTER TABLE auth.usuarios_programas
+            ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+            ALTER COLUMN created_at SET DEFAULT now()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE auth.usuarios_programas
+            ALTER COLUMN created_at DROP DEFAULT,
+            ALTER COLUMN created_at TYPE timestamp USING created_at AT TIME ZONE 'UTC'
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE academic.docentes
+            ALTER COLUMN created_at TYPE timestamp,
+            ALTER COLUMN updated_at TYPE timestamp
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE core.instituicoes
+            ALTER COLUMN created_at TYPE timestamp USING created_at AT TIME ZONE 'UTC',
+            ALTER COLUMN updated_at TYPE timestamp USING updated_at AT TIME ZONE 'UTC',
+            ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+            ALTER COLUMN updated_at SET DEFAULT timezone('utc', now())
+        """
+    )
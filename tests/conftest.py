@@ -4,8 +4,8 @@ import sys
 import importlib
 import urllib.parse
 import pytest
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import ORMExecuteState, raiseload, sessionmaker, Session
 
 # 1) Garanta que a raiz do projeto está no PYTHONPATH
 #    (roda 'pytest' a partir da raiz; isto é só um fallback)
@@ -115,6 +115,27 @@ def db_session() -> Session:
         session.close()
 
 
+@pytest.fixture()
+def strict_loading():
+    """
+    Sessão em que lazy-load (N+1) vira erro, só no teste que pede a fixture.
+    Equivale a ORM_STRICT_LOADING=1 (lazy="raise_on_sql") sem mudar o mapeamento global:
+    todo SELECT da sessão ganha `raiseload("*", sql_only=True)`. Nada é gravado.
+    """
+    session = SessionLocal()
+
+    def _raiseload(state: ORMExecuteState) -> None:
+        if state.is_select and not state.is_relationship_load:
+            state.statement = state.statement.options(raiseload("*", sql_only=True))
+
+    event.listen(session, "do_orm_execute", _raiseload)
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
 @pytest.fixture()
 def client(db_session: Session):
     """
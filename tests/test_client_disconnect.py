@@ -0,0 +1,34 @@
+# tests/test_client_disconnect.py
+from __future__ import annotations
+
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.requests import ClientDisconnect
+
+from app.core.errors import EXCEPTION_HANDLERS
+from app.main import db_session_scope
+
+
+def _app() -> FastAPI:
+    # Mesma pilha do app real (handlers + middleware), com uma rota cujo cliente "sumiu"
+    app = FastAPI(exception_handlers=EXCEPTION_HANDLERS)
+    app.middleware("http")(db_session_scope)
+
+    @app.get("/sumiu")
+    def sumiu() -> None:
+        raise ClientDisconnect()
+
+    return app
+
+
+def test_cliente_desconectado_vira_499_sem_log_de_erro(caplog):
+    # raise_server_exceptions (padrão): se a exceção chegasse ao ServerErrorMiddleware,
+    # o TestClient a relançaria aqui
+    client = TestClient(_app())
+    with caplog.at_level(logging.DEBUG):
+        r = client.get("/sumiu")
+    assert r.status_code == 499
+    assert r.content == b""
+    assert not [rec for rec in caplog.records if rec.levelno >= logging.ERROR]
@@ -0,0 +1,73 @@
+# tests/test_entity_cache.py
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from app.core import entity_cache
+from app.core.entity_cache import cached_read, invalidate_on_write
+from app.schemas.role import RoleRead
+
+
+class _FakeRoleService:
+    """Service mínimo: conta quantas vezes o 'banco' foi consultado."""
+
+    def __init__(self) -> None:
+        self.rows = {1: SimpleNamespace(id=1, nome="admin", descricao=None, ativo=True)}
+        self.hits = 0
+
+    @cached_read("role-test", RoleRead)
+    def get(self, role_id: int):
+        self.hits += 1
+        return self.rows.get(role_id)
+
+    @invalidate_on_write("role-test")
+    def rename(self, role_id: int, nome: str) -> None:
+        self.rows[role_id].nome = nome
+
+
+def test_get_repetido_nao_consulta_o_banco():
+    entity_cache.clear()
+    svc = _FakeRoleService()
+
+    first = svc.get(1)
+    second = svc.get(1)
+
+    assert isinstance(first, RoleRead)
+    assert second is first
+    assert svc.hits == 1
+
+
+def test_escrita_invalida_e_nao_encontrado_nao_e_cacheado():
+    entity_cache.clear()
+    svc = _FakeRoleService()
+
+    svc.get(1)
+    svc.rename(1, "coordenador")
+    assert svc.get(1).nome == "coordenador"
+    assert svc.hits == 2
+
+    assert svc.get(99) is None
+    assert svc.get(99) is None
+    assert svc.hits == 4
+
+
+def test_listagem_serializada_e_descartada_em_escrita():
+    entity_cache.clear()
+    svc = _FakeRoleService()
+    builds = []
+
+    def build() -> bytes:
+        builds.append(1)
+        return b"[]"
+
+    assert entity_cache.cached_payload("role-test", build) == b"[]"
+    assert entity_cache.cached_payload("role-test", build) == b"[]"
+    assert len(builds) == 1
+
+    svc.rename(1, "coordenador")  # update invalida também a listagem
+    entity_cache.cached_payload("role-test", build)
+    assert len(builds) == 2
+
+    entity_cache.invalidate_payload("role-test")  # create
+    entity_cache.cached_payload("role-test", build)
+    assert len(builds) == 3
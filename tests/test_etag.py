@@ -0,0 +1,42 @@
+# tests/test_etag.py
+from __future__ import annotations
+
+from fastapi.responses import Response
+from starlette.requests import Request
+
+from app.core.etag import body_etag, conditional, not_modified
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_etag_muda_com_o_corpo():
+    etag = body_etag(b'{"items":[1]}')
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == body_etag(b'{"items":[1]}')
+    assert etag != body_etag(b'{"items":[]}')  # delete
+    assert etag != body_etag(b'{"items":[2]}')  # update
+
+
+def test_if_none_match():
+    etag = body_etag(b"v")
+    assert not not_modified(_request(), etag)
+    assert not_modified(_request(etag), etag)
+    assert not_modified(_request(f'"outro", W/{etag}'), etag)
+    assert not_modified(_request("*"), etag)
+    assert not not_modified(_request('"outro"'), etag)
+
+
+def test_conditional_responde_304_sem_corpo():
+    body = b'{"items":[]}'
+    first = conditional(_request(), Response(body, media_type="application/json"))
+    assert first.status_code == 200
+    assert first.body == body
+
+    etag = first.headers["etag"]
+    second = conditional(_request(etag), Response(body, media_type="application/json"))
+    assert second.status_code == 304
+    assert second.body == b""
+    assert second.headers["etag"] == etag
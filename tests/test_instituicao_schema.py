@@ -0,0 +1,45 @@
+# tests/test_instituicao_schema.py
+from __future__ import annotations
+
+import warnings
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.serialization import from_orm_fast, schema_fields
+from app.schemas.instituicao import (
+    INSTITUICAO_READ_COERCE,
+    InstituicaoRead,
+    InstituicaoUpdate,
+)
+
+
+def test_cnpj_e_normalizado_para_digitos():
+    assert InstituicaoUpdate(cnpj="12.345.678/0001-95").cnpj == "12345678000195"
+    assert InstituicaoUpdate(cnpj="12345678000195").cnpj == "12345678000195"
+    with pytest.raises(ValidationError):
+        InstituicaoUpdate(cnpj="123")
+
+
+def test_read_rapido_equivale_a_model_validate():
+    """Linha do banco (URLs como str) -> model_construct serializa igual e sem avisos."""
+    row = SimpleNamespace(
+        id=1, codigo="UEPB", nome_completo="Universidade Estadual da Paraíba",
+        nome_abreviado="UEPB", sigla="UEPB", tipo="Estadual", cnpj="12345678000195",
+        natureza_juridica=None, endereco={}, contatos={}, redes_sociais={},
+        logo_url="https://uepb.edu.br/logo.png", website=None, fundacao=None,
+        openalex_institution_id=None, ror_id=None, ativo=True, configuracoes={},
+    )
+    fast = from_orm_fast(
+        InstituicaoRead, row, schema_fields(InstituicaoRead), INSTITUICAO_READ_COERCE
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # PydanticSerializationUnexpectedValue
+        assert fast.model_dump_json() == InstituicaoRead.model_validate(row).model_dump_json()
+
+
+def test_codigo_normalizado_em_maiusculas():
+    assert InstituicaoUpdate(codigo=" uepb ").codigo == "UEPB"
+    with pytest.raises(ValidationError):
+        InstituicaoUpdate(codigo="UE PB")
@@ -0,0 +1,27 @@
+# tests/test_logging.py
+from __future__ import annotations
+
+import logging
+import queue
+import sys
+
+from app.core.logging import DeferredQueueHandler
+
+
+def test_prepare_nao_formata_traceback_na_thread_do_request():
+    try:
+        raise ZeroDivisionError("falhou")
+    except ZeroDivisionError:
+        exc_info = sys.exc_info()
+    record = logging.LogRecord("t", logging.ERROR, __file__, 1, "falhou %s", ("x",), exc_info)
+
+    prepared = DeferredQueueHandler(queue.SimpleQueue()).prepare(record)
+
+    assert prepared.msg == "falhou x" and prepared.args is None
+    # traceback fica para o listener: nada renderizado aqui
+    assert prepared.exc_info is exc_info
+    assert prepared.exc_text is None and record.exc_text is None
+
+    # o formatter do listener ainda monta mensagem + traceback
+    text = logging.Formatter("%(levelname)s %(message)s").format(prepared)
+    assert text.startswith("ERROR falhou x") and "ZeroDivisionError" in text
@@ -0,0 +1,17 @@
+# tests/test_migrations.py
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+_INI = Path(__file__).resolve().parents[1] / "alembic.ini"
+
+
+def test_revisoes_formam_uma_unica_linha():
+    script = ScriptDirectory.from_config(Config(str(_INI)))
+    assert len(script.get_heads()) == 1
+    revisoes = list(script.walk_revisions())
+    assert revisoes[-1].down_revision is None
+    assert all(len(r.nextrev) <= 1 for r in revisoes)  # sem branches
@@ -0,0 +1,34 @@
+# tests/test_pagination.py
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import decode_cursor, encode_cursor, split_page
+
+
+def test_cursor_roundtrip():
+    """O cursor é opaco para o cliente, mas deve voltar ao mesmo id."""
+    assert decode_cursor(encode_cursor(42)) == 42
+    assert decode_cursor(None) is None
+
+
+def test_cursor_invalido_retorna_400():
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor("não-é-base64")
+    assert exc.value.status_code == 400
+
+
+def test_split_page_usa_linha_extra_para_has_more():
+    rows = [SimpleNamespace(id=i) for i in (1, 2, 3)]
+
+    items, next_cursor, has_more = split_page(rows, limit=2)
+    assert [r.id for r in items] == [1, 2]
+    assert has_more is True
+    assert decode_cursor(next_cursor) == 2
+
+    items, next_cursor, has_more = split_page(rows, limit=5)
+    assert len(items) == 3
+    assert has_more is False and next_cursor is None
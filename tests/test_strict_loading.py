@@ -0,0 +1,45 @@
+# tests/test_strict_loading.py
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+from app.models.instituicao import Instituicao
+from app.models.programa import Programa
+
+
+def _programa_id(session) -> int:
+    """Instituição + programa criados na transação da fixture (desfeita no fim)."""
+    inst_id = session.scalar(
+        insert(Instituicao)
+        .values(
+            codigo="STRICT", nome_completo="Strict", nome_abreviado="Strict",
+            sigla="STRICT", tipo="Federal",
+        )
+        .returning(Instituicao.id)
+    )
+    return session.scalar(
+        insert(Programa)
+        .values(instituicao_id=inst_id, nome="Strict", sigla="STR", nivel="Mestrado")
+        .returning(Programa.id)
+    )
+
+
+def test_lazy_load_vira_erro(strict_loading):
+    programa_id = _programa_id(strict_loading)
+    programa = strict_loading.scalars(select(Programa).where(Programa.id == programa_id)).one()
+    with pytest.raises(InvalidRequestError, match="raise_on_sql"):
+        programa.docentes  # noqa: B018  (acesso sob demanda = N+1)
+
+
+def test_carga_explicita_continua_permitida(strict_loading):
+    programa_id = _programa_id(strict_loading)
+    programa = strict_loading.scalars(
+        select(Programa)
+        .where(Programa.id == programa_id)
+        .options(selectinload(Programa.docentes))
+        .execution_options(populate_existing=True)
+    ).one()
+    assert programa.docentes == []